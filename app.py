@@ -12,20 +12,38 @@ Run with:
 
 For production / headless deployment use the systemd service:
     sudo systemctl start tactical-robot
+or a threaded WSGI server (a single worker keeps one set of hardware handles):
+    gunicorn -w 1 --threads 32 --worker-class gthread --keep-alive 75 app:app
+Both keep client connections open between polls. For HTTP/2 multiplexing of
+the dashboard's REST polls and video stream, terminate HTTP/2 in an nginx
+front end and proxy to this server over keep-alive HTTP/1.1.
 ============================================================================
 """
 
 import os
 import time
+import queue
+import atexit
 import logging
+import logging.handlers
 import threading
+import http.client
 from datetime import datetime
 from functools import wraps
+from urllib.parse import urlsplit
 
 from flask import (
     Flask, render_template, Response, request, jsonify, abort
 )
 from flask_socketio import SocketIO, emit
+from werkzeug.serving import WSGIRequestHandler
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
 
 import config
 from modules.hardware.serial_comm    import ArduinoController
@@ -36,36 +54,67 @@ from modules.hardware.led_controller import LEDController
 from modules.system.autonomous       import AutonomousNavigator
 from modules.system.ml_detection     import MLDetector
 from modules.system.sysmon           import SystemMonitor
-from modules.system.telemetry        import TelemetryLogger
+from modules.system.telemetry        import TelemetryLogger, TelemetryBatcher
 
 # ── Logging Setup ────────────────────────────────────────────────────────────
 
 os.makedirs(config.LOG_DIR, exist_ok=True)
 os.makedirs(config.VIDEO_DIR, exist_ok=True)
 
+# Callers only enqueue records; a single listener thread does the console and
+# file I/O, so request handlers never block on the log file.
+_log_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s — %(message)s")
+_log_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler(
+        os.path.join(config.LOG_DIR,
+                     f"app_{datetime.now().strftime('%Y%m%d')}.log")
+    ),
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue: queue.Queue = queue.Queue(-1)
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s — %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(
-            os.path.join(config.LOG_DIR,
-                         f"app_{datetime.now().strftime('%Y%m%d')}.log")
-        ),
-    ],
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_log_handlers, respect_handler_level=True
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # ── Flask & SocketIO ─────────────────────────────────────────────────────────
 
 app = Flask(__name__)
 app.secret_key = config.SECRET_KEY
+app.json.sort_keys = False
+app.json.compact = True
+
+
+# orjson for the Socket.IO payloads as well, when it is installed
+class _OrjsonCodec:
+    """orjson behind the stdlib ``json`` interface expected by python-socketio."""
+
+    @staticmethod
+    def dumps(obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
+# Real OS threads rather than eventlet greenlets: serial flushes, I2C reads and
+# YOLO inference all block in C and would otherwise stall every socket emit.
 socketio = SocketIO(
     app,
-    async_mode="eventlet",
+    async_mode="threading",
     cors_allowed_origins="*",
     logger=False,
     engineio_logger=False,
+    **({"json": _OrjsonCodec} if ORJSON_AVAILABLE else {}),
 )
 
 # ── Hardware & System Initialisation ─────────────────────────────────────────
@@ -80,16 +129,53 @@ ml        = MLDetector()
 navigator = AutonomousNavigator(arduino, imu)
 sysmon    = SystemMonitor()
 telemetry = TelemetryLogger()
+batcher   = TelemetryBatcher()
 
-# Inject ML overlay into camera pipeline
-camera.set_ml_overlay(ml.process_frame)
+# ML inference reads raw frames on its own thread; the camera pipeline only
+# draws the cached boxes.
+ml.set_frame_source(camera.peek_latest_raw)
+camera.set_ml_overlay(ml.draw_overlay)
 
 logger.info("All modules initialised.")
 
+# ── JSON Response Cache ───────────────────────────────────────────────────────
+
+def _dumps(payload) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+# name → (state key, serialised body). Dashboards poll the status endpoints at
+# 1-5 Hz; while the underlying module versions are unchanged the previously
+# serialised bytes are returned as-is.
+_response_cache: dict[str, tuple[tuple, bytes]] = {}
+
+def _cached_json(name: str, key: tuple, build) -> Response:
+    cached = _response_cache.get(name)
+    if cached is None or cached[0] != key:
+        cached = (key, _dumps(build()))
+        _response_cache[name] = cached
+    return Response(cached[1], mimetype="application/json")
+
 # ── Application State ─────────────────────────────────────────────────────────
 
 _recording_filename: str | None = None
 
+# ── Request Validation ────────────────────────────────────────────────────────
+
+# URL direction → motor Arduino command; doubles as the set of valid directions
+DIR_TO_CMD = {
+    "forward":  "FORWARD",
+    "backward": "BACKWARD",
+    "left":     "LEFT",
+    "right":    "RIGHT",
+    "stop":     "STOP",
+    "slow":     "SLOW",
+}
+
+def _clamp(value: int, lo: int, hi: int) -> int:
+    return lo if value < lo else hi if value > hi else value
+
 # ── Auth Decorator ────────────────────────────────────────────────────────────
 
 def require_api_key(f):
@@ -119,56 +205,120 @@ def _update_led_for_state():
 
 # ── Telemetry Broadcast Thread ────────────────────────────────────────────────
 
+# key → (module exposing ``version`` or None, status getter). Versioned modules
+# are only re-read when their counter moves; the others (serial round-trips,
+# navigator state) are re-read every tick and compared by value.
+_TELEMETRY_SOURCES = {
+    "motor":      (None,   arduino.get_motor_status),
+    "servo":      (None,   arduino.get_servo_status),
+    "autonomous": (None,   navigator.get_status),
+    "imu":        (imu,    imu.get_status),
+    "power":      (power,  power.get_status),
+    "system":     (sysmon, sysmon.get_status),
+    "camera":     (camera, camera.get_status),
+    "ml":         (ml,     ml.get_status),
+    "led":        (led,    led.get_status),
+}
+_FULL_SNAPSHOT_EVERY = 20   # ticks — lets (re)connecting clients resync
+_last_telemetry: dict[str, tuple[int | None, dict]] = {}
+
+def _collect_telemetry(force: bool = False) -> dict:
+    """Return ``{key: status}`` for every source that changed since last tick."""
+    changed = {}
+    for key, (module, getter) in _TELEMETRY_SOURCES.items():
+        version = module.version if module is not None else None
+        prev = _last_telemetry.get(key)
+        if not force and prev is not None and version is not None and prev[0] == version:
+            continue
+        value = getter()
+        if force or prev is None or prev[1] != value:
+            changed[key] = value
+        _last_telemetry[key] = (version, value)
+    return changed
+
+def _current_telemetry() -> dict:
+    """Last known status of every source, without touching the hardware."""
+    current = {key: value for key, (_, value) in _last_telemetry.items()}
+    if "camera" in current:
+        current["recording"] = current["camera"]["recording"]
+    return current
+
+# Serialised /api/status body, rebuilt by the broadcast thread whenever the
+# telemetry changes so REST polls never touch the hardware.
+_status_json: bytes | None = None
+
+def _refresh_status_json() -> None:
+    global _status_json
+    current = _current_telemetry()
+    current["connections"] = {
+        "motor_arduino": arduino.motor_connected,
+        "servo_arduino": arduino.servo_connected,
+    }
+    _status_json = _dumps(current)
+
 def _telemetry_broadcast():
-    """Push a full telemetry snapshot to all connected WebSocket clients."""
+    """
+    Push telemetry to all connected WebSocket clients: a ``telemetry_delta``
+    holding only the subsystems that changed, plus a ``telemetry_full``
+    snapshot every _FULL_SNAPSHOT_EVERY ticks. Alerts raised during the tick
+    ride along in the same message. Nothing is sent while idle.
+    """
+    tick = 0
     while True:
         try:
-            snapshot = telemetry.build_snapshot(
-                motor_status      = arduino.get_motor_status(),
-                servo_status      = arduino.get_servo_status(),
-                autonomous_status = navigator.get_status(),
-                imu_status        = imu.get_status(),
-                power_status      = power.get_status(),
-                sysmon_status     = sysmon.get_status(),
-                camera_status     = camera.get_status(),
-                ml_status         = ml.get_status(),
-                led_status        = led.get_status(),
-                recording         = camera.get_status()["recording"],
-            )
-            socketio.emit("telemetry", snapshot)
+            full = tick % _FULL_SNAPSHOT_EVERY == 0
+            if full:
+                status = _collect_telemetry(force=True)
+                status["recording"] = status["camera"]["recording"]
+                telemetry.build_snapshot(
+                    motor_status      = status["motor"],
+                    servo_status      = status["servo"],
+                    autonomous_status = status["autonomous"],
+                    imu_status        = status["imu"],
+                    power_status      = status["power"],
+                    sysmon_status     = status["system"],
+                    camera_status     = status["camera"],
+                    ml_status         = status["ml"],
+                    led_status        = status["led"],
+                    recording         = status["recording"],
+                )
+            else:
+                status = _collect_telemetry()
+                if status:
+                    if "camera" in status:
+                        status["recording"] = status["camera"]["recording"]
+                    telemetry.log_delta(status)
+            if status:
+                _refresh_status_json()
 
             # Targeted alerts
             if power.alert_level == "CRITICAL":
                 led.set_mode("CRITICAL")
-                socketio.emit("alert", {
-                    "level": "CRITICAL", "source": "power",
-                    "message": f"Battery critical: {power.battery_percent:.0f}%"
-                })
+                batcher.add_alert("CRITICAL", "power",
+                                  f"Battery critical: {power.battery_percent:.0f}%")
                 telemetry.log_event("CRITICAL", "power",
                                     f"Battery at {power.battery_percent:.0f}%")
             elif power.alert_level == "WARN":
                 led.set_mode("WARN")
-                socketio.emit("alert", {
-                    "level": "WARN", "source": "power",
-                    "message": f"Battery low: {power.battery_percent:.0f}%"
-                })
+                batcher.add_alert("WARN", "power",
+                                  f"Battery low: {power.battery_percent:.0f}%")
 
             if imu.is_flipped:
-                socketio.emit("alert", {
-                    "level": "CRITICAL", "source": "imu",
-                    "message": "Robot flipped — motors halted."
-                })
+                batcher.add_alert("CRITICAL", "imu", "Robot flipped — motors halted.")
                 telemetry.log_event("CRITICAL", "imu", "Flip detected")
 
             if sysmon.alert_level == "CRITICAL":
-                socketio.emit("alert", {
-                    "level": "WARN", "source": "sysmon",
-                    "message": f"CPU temp critical: {sysmon.cpu_temp}°C"
-                })
+                batcher.add_alert("WARN", "sysmon",
+                                  f"CPU temp critical: {sysmon.cpu_temp:.1f}°C")
+
+            status.update(batcher.drain())
+            if status:
+                socketio.emit("telemetry_full" if full else "telemetry_delta", status)
 
         except Exception as exc:
             logger.debug(f"[Telemetry] Broadcast error: {exc}")
 
+        tick += 1
         time.sleep(config.TELEMETRY_INTERVAL)
 
 
@@ -176,6 +326,58 @@ threading.Thread(
     target=_telemetry_broadcast, daemon=True, name="TelemetryBroadcast"
 ).start()
 
+# ── Video Push (WebSocket) ────────────────────────────────────────────────────
+
+# sid → ack event. A client only receives the next frame once it has
+# acknowledged the previous one, so slow clients are naturally back-pressured
+# instead of accumulating a backlog of stale frames.
+_frame_acks: dict[str, threading.Event] = {}
+_FRAME_ACK_TIMEOUT = 1.0   # re-send if an ack is lost
+_MIN_PUSH_FPS      = 5
+
+# sid → push rate and counters, served by /api/telemetry/stats
+_push_stats: dict[str, dict] = {}
+
+def _push_frames(sid: str, ack: threading.Event) -> None:
+    """
+    Push the newest JPEG frame to one client, one frame per ack. The target
+    rate follows the ack round-trip time (clipped to 5…CAMERA_FRAMERATE);
+    camera frames that arrive in between are dropped, never queued.
+    """
+    stats = {"fps": float(config.CAMERA_FRAMERATE), "rtt_ms": 0.0, "sent": 0, "dropped": 0}
+    _push_stats[sid] = stats
+    last_seq  = 0
+    last_sent = 0.0
+    awaiting  = False
+    try:
+        while _frame_acks.get(sid) is ack:
+            acked = ack.wait(timeout=_FRAME_ACK_TIMEOUT)
+            ack.clear()
+            if awaiting:
+                rtt = time.monotonic() - last_sent if acked else _FRAME_ACK_TIMEOUT
+                stats["rtt_ms"] = round(rtt * 1000, 1)
+                stats["fps"] = round(
+                    min(config.CAMERA_FRAMERATE, max(_MIN_PUSH_FPS, 1.0 / max(rtt, 1e-3))), 1
+                )
+                awaiting = False
+            remaining = last_sent + 1.0 / stats["fps"] - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            seq, frame = camera.wait_for_frame(last_seq, timeout=_FRAME_ACK_TIMEOUT)
+            if frame is not None and seq != last_seq:
+                if last_seq:
+                    stats["dropped"] += max(0, seq - last_seq - 1)
+                socketio.emit("frame", frame, to=sid)
+                stats["sent"] += 1
+                last_seq  = seq
+                last_sent = time.monotonic()
+                awaiting  = True
+            else:
+                ack.set()   # nothing new sent — don't wait for an ack
+    finally:
+        if _push_stats.get(sid) is stats:
+            del _push_stats[sid]
+
 # ============================================================================
 # ROUTES — Pages
 # ============================================================================
@@ -186,26 +388,66 @@ def index():
 
 @app.route("/video_feed")
 def video_feed():
+    """MJPEG fallback stream (also used when no hardware H.264 is present)."""
     return Response(
         camera.generate_frames(),
         mimetype="multipart/x-mixed-replace; boundary=frame",
     )
 
+@app.route("/video_feed.mp4")
+def video_feed_h264():
+    """Hardware-encoded H.264 as fragmented MP4 — far less bandwidth than MJPEG."""
+    if not camera.h264_available:
+        return jsonify({"error": "H.264 stream not available"}), 404
+    return Response(camera.generate_h264(), mimetype="video/mp4")
+
+# URL scheme → connection class for the ESP32-CAM proxy (port None = default)
+_ESP32_CONNECTIONS = {
+    "http":  http.client.HTTPConnection,
+    "https": http.client.HTTPSConnection,
+}
+
 @app.route("/esp32_feed")
 def esp32_feed():
     """Proxy ESP32-CAM stream if configured."""
     esp_url = config.ESP32_CAM_URL
     if not esp_url:
         return jsonify({"error": "ESP32-CAM URL not configured"}), 404
-    import requests as req
+    url = urlsplit(esp_url)
+    conn_cls = _ESP32_CONNECTIONS.get(url.scheme)
+    if conn_cls is None or not url.hostname:
+        logger.warning(f"[ESP32] Unsupported stream URL: {esp_url!r}")
+        return jsonify({"error": "ESP32-CAM URL must be http:// or https://"}), 502
+    conn = None
+    try:
+        # url.port raises ValueError for a malformed port
+        conn = conn_cls(url.hostname, url.port, timeout=5)
+        conn.request("GET", (url.path or "/") + (f"?{url.query}" if url.query else ""))
+        upstream = conn.getresponse()
+    except Exception as exc:
+        if conn is not None:
+            conn.close()
+        logger.warning(f"[ESP32] Stream error: {exc}")
+        return jsonify({"error": "ESP32-CAM unreachable"}), 502
+    if upstream.status != 200:
+        conn.close()
+        logger.warning(f"[ESP32] Stream returned HTTP {upstream.status}")
+        return jsonify({"error": f"ESP32-CAM returned HTTP {upstream.status}"}), 502
+
     def _proxy():
+        # read1() returns whatever the socket has buffered, so frames are
+        # relayed as they arrive without re-chunking or parsing.
         try:
-            with req.get(esp_url, stream=True, timeout=5) as r:
-                for chunk in r.iter_content(chunk_size=4096):
-                    yield chunk
+            while chunk := upstream.read1(65536):
+                yield chunk
         except Exception as exc:
             logger.warning(f"[ESP32] Stream error: {exc}")
-    return Response(_proxy(), mimetype="multipart/x-mixed-replace; boundary=frame")
+        finally:
+            conn.close()
+    content_type = upstream.getheader(
+        "Content-Type", "multipart/x-mixed-replace; boundary=frame"
+    )
+    return Response(_proxy(), content_type=content_type)
 
 # ============================================================================
 # ROUTES — Motor Control API
@@ -213,11 +455,11 @@ def esp32_feed():
 
 @app.route("/api/motor/<direction>", methods=["POST"])
 def motor_command(direction: str):
-    valid = {"forward", "backward", "left", "right", "stop", "slow"}
     direction = direction.lower()
-    if direction not in valid:
+    cmd = DIR_TO_CMD.get(direction)
+    if cmd is None:
         return jsonify({"success": False, "error": "Invalid direction"}), 400
-    ok = arduino.send_motor_command(direction.upper())
+    ok = arduino.send_motor_command(cmd)
     if ok and direction not in ("stop", "slow"):
         led.set_mode("MOVING")
     elif direction == "stop":
@@ -233,7 +475,7 @@ def motor_command(direction: str):
 def set_speed():
     data  = request.get_json(silent=True) or {}
     speed = int(data.get("speed", config.DEFAULT_SPEED))
-    speed = max(config.MIN_SPEED, min(config.MAX_SPEED, speed))
+    speed = _clamp(speed, config.MIN_SPEED, config.MAX_SPEED)
     ok    = arduino.send_motor_command(f"SPEED:{speed}")
     return jsonify({"success": ok, "speed": speed})
 
@@ -246,7 +488,7 @@ def servo_set():
     data  = request.get_json(silent=True) or {}
     servo = int(data.get("servo", 1))
     angle = int(data.get("angle", config.SERVO_CENTER_ANGLE))
-    angle = max(config.SERVO_MIN_ANGLE, min(config.SERVO_MAX_ANGLE, angle))
+    angle = _clamp(angle, config.SERVO_MIN_ANGLE, config.SERVO_MAX_ANGLE)
     ok    = arduino.send_servo_command(f"S{servo}:{angle}")
     return jsonify({
         "success": ok, "servo": servo, "angle": angle,
@@ -294,7 +536,7 @@ def autonomous_stop():
 
 @app.route("/api/autonomous/status", methods=["GET"])
 def autonomous_status_route():
-    return jsonify(navigator.get_status())
+    return Response(_dumps(navigator.get_status()), mimetype="application/json")
 
 # ============================================================================
 # ROUTES — ML Detection API
@@ -304,6 +546,11 @@ def autonomous_status_route():
 def ml_toggle():
     data   = request.get_json(silent=True) or {}
     enable = data.get("enable", True)
+    if "fps" in data:
+        try:
+            ml.set_target_fps(data["fps"])
+        except (TypeError, ValueError):
+            return jsonify({"success": False, "error": "Invalid fps"}), 400
     if enable:
         ok = ml.enable()
     else:
@@ -316,7 +563,7 @@ def ml_toggle():
 
 @app.route("/api/ml/detections", methods=["GET"])
 def ml_detections():
-    return jsonify(ml.get_status())
+    return _cached_json("ml", (ml.version,), ml.get_status)
 
 # ============================================================================
 # ROUTES — LED Control API
@@ -332,9 +579,9 @@ def led_mode():
 @app.route("/api/led/color", methods=["POST"])
 def led_color():
     data = request.get_json(silent=True) or {}
-    r = max(0, min(255, int(data.get("r", 0))))
-    g = max(0, min(255, int(data.get("g", 0))))
-    b = max(0, min(255, int(data.get("b", 0))))
+    r = _clamp(int(data.get("r", 0)), 0, 255)
+    g = _clamp(int(data.get("g", 0)), 0, 255)
+    b = _clamp(int(data.get("b", 0)), 0, 255)
     led.set_custom_color(r, g, b)
     return jsonify({"success": True, "color": [r, g, b]})
 
@@ -371,36 +618,42 @@ def recording_stop():
 
 @app.route("/api/sensors", methods=["GET"])
 def sensors():
-    return jsonify({
-        "distances": arduino.get_all_distances(),
+    distances = arduino.get_all_distances()
+    key = (imu.version, power.version, distances)
+    return _cached_json("sensors", key, lambda: {
+        "distances": distances._asdict(),
         "imu":       imu.get_status(),
         "power":     power.get_status(),
     })
 
 @app.route("/api/status", methods=["GET"])
 def status():
-    return jsonify({
-        "motor":       arduino.get_motor_status(),
-        "servo":       arduino.get_servo_status(),
-        "autonomous":  navigator.get_status(),
-        "imu":         imu.get_status(),
-        "power":       power.get_status(),
-        "system":      sysmon.get_status(),
-        "camera":      camera.get_status(),
-        "ml":          ml.get_status(),
-        "led":         led.get_status(),
-        "recording":   camera.get_status()["recording"],
-        "connections": {
-            "motor_arduino": arduino.motor_connected,
-            "servo_arduino": arduino.servo_connected,
-        },
-    })
+    """Last broadcast telemetry, served from the broadcast thread's cache."""
+    body = _status_json
+    if body is None:
+        return jsonify({"error": "Telemetry not ready"}), 503
+    return Response(body, mimetype="application/json")
 
 @app.route("/api/events", methods=["GET"])
 def events():
     n = int(request.args.get("n", 100))
     return jsonify({"events": telemetry.get_recent_events(n)})
 
+@app.route("/api/serial/log", methods=["GET"])
+def serial_log():
+    """Recent reply lines from both Arduinos, for UI scrollback."""
+    n = int(request.args.get("n", 50))
+    return jsonify(arduino.get_recent_lines(n))
+
+@app.route("/api/telemetry/stats", methods=["GET"])
+def telemetry_stats():
+    """Per-client video push rate, ack round-trip and dropped-frame counts."""
+    clients = {sid: dict(stats) for sid, stats in list(_push_stats.items())}
+    return jsonify({
+        "clients":        clients,
+        "dropped_frames": sum(c["dropped"] for c in clients.values()),
+    })
+
 # ============================================================================
 # WEBSOCKET EVENTS
 # ============================================================================
@@ -409,19 +662,60 @@ def events():
 def on_connect():
     logger.info(f"[WS] Client connected: {request.sid}")
     emit("connected", {"message": "Tactical Robot Control System online."})
+    if _last_telemetry:
+        emit("telemetry_full", _current_telemetry())
 
 @socketio.on("disconnect")
 def on_disconnect():
     logger.info(f"[WS] Client disconnected: {request.sid}")
+    ack = _frame_acks.pop(request.sid, None)
+    if ack:
+        ack.set()
+
+@socketio.on("video_subscribe")
+def on_video_subscribe():
+    """Start pushing binary JPEG frames to this client over the socket."""
+    sid = request.sid
+    if sid in _frame_acks:
+        return
+    ack = threading.Event()
+    ack.set()
+    _frame_acks[sid] = ack
+    threading.Thread(
+        target=_push_frames, args=(sid, ack), daemon=True, name=f"FramePush-{sid}"
+    ).start()
+
+@socketio.on("video_unsubscribe")
+def on_video_unsubscribe():
+    ack = _frame_acks.pop(request.sid, None)
+    if ack:
+        ack.set()
+
+@socketio.on("frame_ack")
+def on_frame_ack():
+    ack = _frame_acks.get(request.sid)
+    if ack:
+        ack.set()
 
 @socketio.on("request_update")
 def on_request_update():
-    emit("status_update", arduino.get_motor_status())
+    # Re-send the cached motor status rather than querying the Arduino
+    cached = _last_telemetry.get("motor")
+    emit("status_update", cached[1] if cached else {"connected": arduino.motor_connected})
 
 @socketio.on("ping_latency")
 def on_ping(data):
     emit("pong_latency", data)
 
+# ============================================================================
+# HTTP SERVER
+# ============================================================================
+
+class _KeepAliveRequestHandler(WSGIRequestHandler):
+    # Werkzeug speaks HTTP/1.0 by default and closes the socket after every
+    # response; HTTP/1.1 lets status polls reuse one connection.
+    protocol_version = "HTTP/1.1"
+
 # ============================================================================
 # ENTRY POINT
 # ============================================================================
@@ -437,6 +731,8 @@ if __name__ == "__main__":
             host=config.APP_HOST,
             port=config.APP_PORT,
             debug=config.APP_DEBUG,
+            allow_unsafe_werkzeug=True,
+            request_handler=_KeepAliveRequestHandler,
         )
     finally:
         logger.info("Shutting down…")
@@ -444,4 +740,5 @@ if __name__ == "__main__":
         camera.cleanup()
         led.cleanup()
         arduino.close()
+        sysmon.shutdown()
         telemetry.close()
@@ -28,6 +28,8 @@
   Serial Protocol (115200 baud):
     Commands (Raspberry Pi → Arduino):
       FORWARD | BACKWARD | LEFT | RIGHT | STOP | SLOW
+      SEQ:<CMD>,<ms>;<CMD>,<ms>;…  — timed motion steps run on the Arduino's
+                                   own clock; any motion command cancels
       SPEED:<0-255>
       DF | DL | DR | DA          — query distances
       LED:<MODE>                 — IDLE|MOVING|AUTO|RECORD|WARN|CRITICAL|NIGHT|ML|OFF
@@ -41,6 +43,7 @@
       DIST_R:<cm>
       DIST_ALL:<front>,<left>,<right>
       STATUS:<speed>,<dir>,<front_dist>
+      T:<front>,<left>,<right>,<speed>,<dir>  — streamed every TELEM_INTERVAL ms
 ============================================================================
 */
 
@@ -72,6 +75,7 @@
 #define BAUD_RATE        115200
 #define MAX_DISTANCE_CM  300
 #define SOUND_SPEED_DIV  58
+#define TELEM_INTERVAL   20        // ms — one sensor measured + one T: frame per tick
 
 // ── Globals ──────────────────────────────────────────────────────────────────
 
@@ -79,6 +83,12 @@ int    motorSpeed    = 200;
 String direction     = "STOP";
 String inputBuffer   = "";
 
+// Streamed telemetry: the sensors are measured round-robin, one per tick, so
+// a missing echo blocks the loop for at most one pulseIn timeout
+long          telemDist[3]   = {0, 0, 0};   // front, left, right
+int           telemSensor    = 0;
+unsigned long telemLast      = 0;
+
 INA219_WE        ina219;
 bool             inaAvailable = false;
 Adafruit_NeoPixel strip(LED_COUNT, LED_PIN, NEO_GRB + NEO_KHZ800);
@@ -171,15 +181,89 @@ void motorSlow() {
   direction = "SLOW";
 }
 
-// ── Command Parser ────────────────────────────────────────────────────────────
-
-void processCommand(const String& cmd) {
+bool runMotion(const String& cmd) {
   if      (cmd == "FORWARD")  motorForward();
   else if (cmd == "BACKWARD") motorBackward();
   else if (cmd == "LEFT")     motorLeft();
   else if (cmd == "RIGHT")    motorRight();
   else if (cmd == "STOP")     motorStop();
   else if (cmd == "SLOW")     motorSlow();
+  else return false;
+  return true;
+}
+
+// ── Command Sequences ─────────────────────────────────────────────────────────
+
+#define SEQ_MAX_STEPS 8
+
+String        seqCmd[SEQ_MAX_STEPS];
+unsigned long seqMs[SEQ_MAX_STEPS];
+int           seqLen       = 0;
+int           seqIndex     = 0;
+unsigned long seqStepStart = 0;
+
+void seqStart(const String& spec) {
+  seqLen = 0;
+  int start = 0;
+  while (start < (int)spec.length() && seqLen < SEQ_MAX_STEPS) {
+    int end = spec.indexOf(';', start);
+    if (end < 0) end = spec.length();
+    String step = spec.substring(start, end);
+    int comma = step.indexOf(',');
+    if (comma > 0) {
+      seqCmd[seqLen] = step.substring(0, comma);
+      seqMs[seqLen]  = step.substring(comma + 1).toInt();
+      seqLen++;
+    }
+    start = end + 1;
+  }
+  seqIndex = 0;
+  if (seqLen > 0) {
+    runMotion(seqCmd[0]);
+    seqStepStart = millis();
+  }
+}
+
+void seqTick() {
+  if (seqIndex >= seqLen) return;
+  if (millis() - seqStepStart < seqMs[seqIndex]) return;
+  seqIndex++;
+  if (seqIndex < seqLen) {
+    runMotion(seqCmd[seqIndex]);
+    seqStepStart = millis();
+  } else {
+    seqLen = 0;
+  }
+}
+
+// ── Telemetry Stream ──────────────────────────────────────────────────────────
+
+void telemTick() {
+  if (millis() - telemLast < TELEM_INTERVAL) return;
+  telemLast = millis();
+  switch (telemSensor) {
+    case 0: telemDist[0] = measureDistance(TRIG_FRONT, ECHO_FRONT); break;
+    case 1: telemDist[1] = measureDistance(TRIG_LEFT,  ECHO_LEFT);  break;
+    case 2: telemDist[2] = measureDistance(TRIG_RIGHT, ECHO_RIGHT); break;
+  }
+  telemSensor = (telemSensor + 1) % 3;
+  Serial.print("T:");
+  Serial.print(telemDist[0]); Serial.print(",");
+  Serial.print(telemDist[1]); Serial.print(",");
+  Serial.print(telemDist[2]); Serial.print(",");
+  Serial.print(motorSpeed);   Serial.print(",");
+  Serial.println(direction);
+}
+
+// ── Command Parser ────────────────────────────────────────────────────────────
+
+void processCommand(const String& cmd) {
+  if (runMotion(cmd)) {
+    seqLen = 0;   // a direct motion command cancels any running sequence
+  }
+  else if (cmd.startsWith("SEQ:")) {
+    seqStart(cmd.substring(4));
+  }
 
   else if (cmd.startsWith("SPEED:")) {
     motorSpeed = constrain(cmd.substring(6).toInt(), 0, 255);
@@ -272,6 +356,7 @@ void loop() {
           Serial.read();
         }
         motorStop();
+        seqLen = 0;
         inputBuffer = "";
         return;
       }
@@ -281,4 +366,6 @@ void loop() {
       inputBuffer += c;
     }
   }
+  seqTick();
+  telemTick();
 }
@@ -22,14 +22,16 @@
       CENTER            — centre all servos to 90°
       PRESET:<1-4>      — load named preset
       SCAN              — 180° sweep on servo 1
-      IMU               — request IMU reading
+      IMU               — request an IMU reading now
       BUZZ:<freq>,<ms>  — play tone at freq Hz for ms milliseconds
       ?                 — full status
 
     Responses (Arduino → Raspberry Pi):
       SERVO_READY
       OK
-      IMU:<pitch>,<roll>,<ax>,<ay>,<az>
+      0xAA 0x55 <pitch,roll,ax,ay,az as 5×float32 LE> <sum8>
+                        — binary IMU frame (23 B); streamed every IMU_INTERVAL
+                          ms and sent in reply to IMU
       FLIP:1            — flip detected
       SCAN_POS:<angle>  — current scan angle
       STATUS:<s1>,<s2>,<s3>,<s4>
@@ -55,7 +57,7 @@
 #define SERVO_MAX       180
 #define SERVO_CENTER    90
 #define FLIP_THRESHOLD  45.0
-#define IMU_INTERVAL    200
+#define IMU_INTERVAL    50        // ms — IMU sample + stream period (20 Hz)
 
 // ── Globals ──────────────────────────────────────────────────────────────────
 
@@ -129,6 +131,24 @@ void buzzAlert(int level) {
 
 // ── IMU ───────────────────────────────────────────────────────────────────────
 
+// Binary frame: sync bytes, five little-endian floats (AVR floats are IEEE-754
+// LE already), then an 8-bit sum of the payload bytes for resync
+void sendIMUFrame(float p, float r, float ax, float ay, float az) {
+  float v[5] = {p, r, ax, ay, az};
+  const uint8_t* b = (const uint8_t*)v;
+  uint8_t sum = 0;
+  for (uint8_t i = 0; i < sizeof(v); i++) sum += b[i];
+  Serial.write(0xAA);
+  Serial.write(0x55);
+  Serial.write(b, sizeof(v));
+  Serial.write(sum);
+}
+
+void printIMU() {
+  sendIMUFrame(mpu.getAngleX(), mpu.getAngleY(),
+               mpu.getAccX(), mpu.getAccY(), mpu.getAccZ());
+}
+
 void updateIMU() {
   if (!mpuAvailable) return;
   unsigned long now = millis();
@@ -138,6 +158,7 @@ void updateIMU() {
   mpu.update();
   pitch = mpu.getAngleX();
   roll  = mpu.getAngleY();
+  printIMU();   // push every sample; the Pi no longer has to ask
 
   bool flippedNow = (abs(pitch) > FLIP_THRESHOLD || abs(roll) > FLIP_THRESHOLD);
   if (flippedNow && !isFlipped) {
@@ -175,14 +196,9 @@ void processCommand(const String& cmd) {
   else if (cmd == "IMU") {
     if (mpuAvailable) {
       mpu.update();
-      Serial.print("IMU:");
-      Serial.print(mpu.getAngleX(), 2); Serial.print(",");
-      Serial.print(mpu.getAngleY(), 2); Serial.print(",");
-      Serial.print(mpu.getAccX(),   3); Serial.print(",");
-      Serial.print(mpu.getAccY(),   3); Serial.print(",");
-      Serial.println(mpu.getAccZ(), 3);
+      printIMU();
     } else {
-      Serial.println("IMU:0,0,0,0,0");
+      sendIMUFrame(0, 0, 0, 0, 0);
     }
   }
   else if (cmd.startsWith("BUZZ:")) {
@@ -20,8 +20,13 @@ API_KEY         = os.environ.get("ROBOT_API_KEY", "tactical-robot-api-key")
 # ── Serial / Arduino ────────────────────────────────────────────────────────
 BAUD_RATE           = 115200
 SERIAL_TIMEOUT      = 1.0        # seconds
+SERIAL_WRITE_TIMEOUT= 0.2        # seconds — a write blocked longer marks the port lost
 RECONNECT_INTERVAL  = 5.0        # seconds between reconnect attempts
 MAX_RECONNECT_TRIES = 10
+# USB serial numbers (python -m serial.tools.list_ports -v) pin each board to
+# its port without the 2 s READY handshake probe; leave empty to probe
+MOTOR_USB_SERIAL    = os.environ.get("ROBOT_MOTOR_USB_SERIAL", "")
+SERVO_USB_SERIAL    = os.environ.get("ROBOT_SERVO_USB_SERIAL", "")
 
 # ── Camera ──────────────────────────────────────────────────────────────────
 CAMERA_RESOLUTION   = (640, 480)
@@ -29,10 +34,26 @@ CAMERA_FRAMERATE    = 30
 CAMERA_JPEG_QUALITY = 80         # 1-100; lower = less CPU, more compression
 ESP32_CAM_URL       = ""         # e.g. "http://192.168.1.50/stream"
 
+# Hardware H.264 stream (Pi V4L2 M2M encoder, remuxed to fMP4 by ffmpeg).
+# MJPEG remains available as a fallback when the encoder or ffmpeg is missing.
+H264_STREAM_ENABLED = True
+H264_BITRATE        = 2_000_000  # bits/s
+H264_I_FRAME_PERIOD = 15         # frames between keyframes (= fragment length)
+
+# Hardware MJPEG encoder for /video_feed and the socket frame push. Frames
+# that carry an ML overlay are still JPEG-encoded in software.
+MJPEG_HW_ENABLED    = True
+MJPEG_BITRATE       = 10_000_000 # bits/s
+
+# Software (OpenCV) recordings start a new _partNN file after this many
+# seconds, so a stop or power loss only ever touches the last segment
+RECORDING_SEGMENT_SEC = 30       # 0 = one file per recording
+
 # ── Motor Control ───────────────────────────────────────────────────────────
 DEFAULT_SPEED   = 200            # 0-255 PWM
 MIN_SPEED       = 50
 MAX_SPEED       = 255
+MOTOR_REPEAT_INTERVAL = 0.5      # s — identical commands within this are dropped
 
 # ── Servo Control ───────────────────────────────────────────────────────────
 SERVO_MIN_ANGLE     = 0
@@ -45,6 +66,8 @@ SERVO_SCAN_DELAY    = 0.05       # seconds between sweep steps
 OBSTACLE_STOP_DISTANCE  = 25     # cm — stop and avoid
 OBSTACLE_WARN_DISTANCE  = 40     # cm — slow down / warn
 SENSOR_SCAN_INTERVAL    = 0.15   # seconds between distance polls
+SENSOR_POLL_HZ          = 10     # DA query rate when the T: stream is absent
+SENSOR_STALE_AFTER      = 0.5    # s — older distance readings halt autonomous driving
 
 # ── IMU (MPU-6050) ──────────────────────────────────────────────────────────
 IMU_I2C_ADDRESS     = 0x68
@@ -58,6 +81,8 @@ BATTERY_EMPTY_VOLTAGE   = 6.4    # V — 2S Li-ion cutoff
 BATTERY_WARN_PERCENT    = 20     # % — trigger low-battery alert
 BATTERY_CRITICAL_PERCENT= 10     # % — trigger emergency shutdown
 SHUNT_OHMS              = 0.1    # Ω — INA219 shunt resistor value
+POWER_SAMPLE_INTERVAL   = 1.0    # s — INA219 sample period while battery is OK
+POWER_ALERT_INTERVAL    = 0.2    # s — sample period in WARN / CRITICAL
 
 # ── LED Strip (WS2812B) ──────────────────────────────────────────────────────
 LED_PIN             = 18         # GPIO pin (BCM) on Raspberry Pi
@@ -66,6 +91,7 @@ LED_BRIGHTNESS      = 128        # 0-255
 LED_FREQ_HZ         = 800000
 LED_DMA             = 10
 LED_INVERT          = False
+LED_RENDER_HZ       = 60         # max strip refresh rate (show() calls/s)
 
 # LED colour presets (R, G, B)
 LED_COLOR_IDLE      = (0,   80,  0)    # dim green
@@ -82,12 +108,17 @@ LED_COLOR_OFF       = (0,   0,   0)
 LOG_DIR             = "data/logs"
 VIDEO_DIR           = "data/videos"
 MAX_MEMORY_LOGS     = 2000
+UI_HISTORY_LEN      = 60         # samples per chart in get_status()
 TELEMETRY_INTERVAL  = 0.5        # seconds between WebSocket telemetry pushes
 
 # ── ML Detection ────────────────────────────────────────────────────────────
-ML_MODEL_NAME           = "yolov8n.pt"   # use NCNN export for best Pi perf
+ML_MODEL_NAME           = "yolov8n.pt"   # NCNN export > ONNX export (same stem) > .pt
 ML_CONFIDENCE_THRESHOLD = 0.50
+ML_NMS_IOU              = 0.45          # ONNX path: overlap above which boxes merge
 ML_DETECTION_FPS        = 5             # max detection frames per second
+ML_IMGSZ                = 320           # .pt / NCNN path: letterboxed input size (export NCNN at this size)
+ML_TORCH_COMPILE        = False         # .pt path: wrap the model in torch.compile (torch ≥ 2)
+ML_PRECISION            = "fp32"        # "fp16" (CUDA only) | "int8" (use an int8 export) | "fp32"
 
 # ── Autonomous Navigation ────────────────────────────────────────────────────
 AUTO_EXPLORE_TURN_MIN   = 0.5    # seconds
@@ -99,3 +130,10 @@ AUTO_PATROL_TURN_SEC    = 0.7    # seconds for 90° turn
 SYSMON_INTERVAL         = 2.0    # seconds between system metric samples
 CPU_WARN_TEMP           = 70.0   # °C
 CPU_CRITICAL_TEMP       = 80.0   # °C
+
+# ── CPU Affinity ─────────────────────────────────────────────────────────────
+# Pin latency-sensitive threads to fixed cores (None = leave to the scheduler).
+# Pair with "isolcpus=3 nohz_full=3" in /boot/firmware/cmdline.txt so nothing
+# else is scheduled on the capture core.
+CAPTURE_CPU             = 3
+AUTONOMOUS_CPU          = 2
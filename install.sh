@@ -66,7 +66,7 @@ pip install Flask==3.0.0
 pip install flask-socketio==5.3.5
 pip install python-socketio==5.10.0
 pip install python-engineio==4.8.0
-pip install eventlet==0.33.3
+pip install simple-websocket==1.0.0
 pip install pyserial==3.5
 
 echo ""
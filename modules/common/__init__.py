@@ -0,0 +1 @@
+# Shared helpers with no hardware or system dependencies
@@ -0,0 +1,24 @@
+"""
+============================================================================
+COMMON MODULE — CPU AFFINITY
+============================================================================
+Pins latency-sensitive threads (camera capture, autonomous driving) to the
+cores named in config.py. Depends on nothing else in the project.
+============================================================================
+"""
+
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def pin_current_thread(cpu: int | None, label: str) -> None:
+    """Pin the calling thread to one CPU core (Linux only; None is a no-op)."""
+    if cpu is None or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(0, {cpu})
+        logger.info(f"[Affinity] {label} thread pinned to CPU {cpu}.")
+    except OSError as exc:
+        logger.warning(f"[Affinity] Could not pin {label} thread to CPU {cpu}: {exc}")
@@ -0,0 +1,41 @@
+"""
+============================================================================
+COMMON MODULE — HISTORY RING
+============================================================================
+Fixed-size float history shared by the hardware and system monitors that
+feed the UI charts. Depends on nothing else in the project.
+============================================================================
+"""
+
+from array import array
+
+
+class HistoryRing:
+    """
+    Fixed-size ring of float samples stored in one contiguous array
+    (8 B per sample rather than a pointer plus a boxed float per entry).
+    """
+    __slots__ = ("_buf", "_size", "_head", "_count")
+
+    def __init__(self, size: int):
+        self._buf = array("d", bytes(8 * size))
+        self._size = size
+        self._head = 0
+        self._count = 0
+
+    def append(self, value: float) -> None:
+        self._buf[self._head] = value
+        self._head = (self._head + 1) % self._size
+        if self._count < self._size:
+            self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def latest(self, n: int) -> list:
+        """The newest ``n`` samples, oldest first."""
+        n = min(n, self._count)
+        head = self._head
+        if n <= head:
+            return self._buf[head - n:head].tolist()
+        return self._buf[self._size - (n - head):].tolist() + self._buf[:head].tolist()
@@ -3,26 +3,33 @@
 HARDWARE MODULE — CAMERA MANAGER
 ============================================================================
 Manages the primary Pi Camera (via picamera2) and an optional secondary
-ESP32-CAM stream. Provides MJPEG frame generation for Flask streaming
-and supports ML overlay injection. Falls back to a test pattern when no
-camera hardware is available.
+ESP32-CAM stream. Provides a hardware-encoded H.264 (fragmented MP4) stream
+plus MJPEG frame generation for Flask streaming, and supports ML overlay
+injection. Falls back to a test pattern when no camera hardware is available.
 ============================================================================
 """
 
 import io
+import os
 import time
+import shutil
 import threading
+import subprocess
 import logging
+from collections import deque
 from config import (
-    CAMERA_RESOLUTION, CAMERA_FRAMERATE, CAMERA_JPEG_QUALITY, ESP32_CAM_URL
+    CAMERA_RESOLUTION, CAMERA_FRAMERATE, CAMERA_JPEG_QUALITY, ESP32_CAM_URL,
+    H264_STREAM_ENABLED, H264_BITRATE, H264_I_FRAME_PERIOD,
+    MJPEG_HW_ENABLED, MJPEG_BITRATE, RECORDING_SEGMENT_SEC, CAPTURE_CPU,
 )
+from modules.common.affinity import pin_current_thread
 
 logger = logging.getLogger(__name__)
 
 try:
     from picamera2 import Picamera2
-    from picamera2.encoders import MJPEGEncoder
-    from picamera2.outputs import FileOutput
+    from picamera2.encoders import MJPEGEncoder, H264Encoder
+    from picamera2.outputs import FileOutput, CircularOutput
     PICAMERA2_AVAILABLE = True
 except ImportError:
     PICAMERA2_AVAILABLE = False
@@ -35,23 +42,242 @@ try:
 except ImportError:
     CV2_AVAILABLE = False
 
+try:
+    # libjpeg-turbo SIMD (NEON on the Pi) — several times faster than imencode
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJSAMP_420
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
+
+# Multipart boundary + headers preceding every JPEG in the MJPEG stream
+_MJPEG_PART_HEADER  = b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+_MJPEG_PART_TRAILER = b"\r\n"
+
+# Software recording: most copies of one frame written to cover a capture
+# stall; a longer gap is dropped from the clip instead
+_REC_MAX_REPEAT = 3
+_REC_QUEUE_LEN  = 8      # frames buffered for the encoder; oldest dropped beyond
+_CAPTURE_WARN_MISSES = 30   # consecutive failed captures before a warning
+# Software-recording codecs, cheapest first: H.264 through OpenCV's FFmpeg
+# backend (tuned for speed below), then OpenCV's built-in MPEG-4 Part 2
+_REC_CODECS = ("avc1", "mp4v")
+_FFMPEG_WRITER_OPTIONS = "preset;ultrafast|tune;zerolatency"
+
+
+def _drop_page_cache(path: str) -> None:
+    """
+    Tell the kernel a finished recording won't be read back soon, so its
+    pages don't push camera buffers and model weights out of the cache.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)   # dirty pages can't be dropped until written
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError as exc:
+        logger.debug(f"[Camera] fadvise skipped for {path}: {exc}")
+
+
+def _partial_path(path: str) -> str:
+    """Name a recording is written under until it is complete on disk."""
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.partial{ext}"   # keep the extension — it picks the container
+
+
+def _finalise_recording(path: str) -> None:
+    """Flush a finished recording and move it to its final name atomically."""
+    partial = _partial_path(path)
+    _drop_page_cache(partial)   # fsyncs, so the rename never exposes a torn file
+    try:
+        os.replace(partial, path)
+    except OSError as exc:
+        logger.warning(f"[Camera] Could not finalise {partial}: {exc}")
+
+
+def _open_video_writer(filepath: str, size: tuple[int, int]):
+    """Open the first software VideoWriter codec that works; None if none do."""
+    # Read by OpenCV when an FFmpeg writer opens; an operator's value wins
+    os.environ.setdefault("OPENCV_FFMPEG_WRITER_OPTIONS", _FFMPEG_WRITER_OPTIONS)
+    for codec in _REC_CODECS:
+        writer = cv2.VideoWriter(
+            filepath, cv2.CAP_FFMPEG, cv2.VideoWriter_fourcc(*codec),
+            CAMERA_FRAMERATE, size,
+        )
+        if writer.isOpened():
+            logger.info(f"[Camera] Software recording codec: {codec}")
+            return writer
+        writer.release()
+    return None
+
+
+class _FragmentedMP4Stream:
+    """
+    Remuxes the hardware H.264 bitstream into fragmented MP4 with ffmpeg
+    (stream copy — no re-encode) and republishes the fragments so any number
+    of HTTP clients can join mid-stream. Each client receives the init
+    segment (ftyp + moov) followed by the newest moof + mdat fragments.
+    Fragments are cut on keyframes only, so every one is independently
+    decodable.
+    """
+
+    _FFMPEG_CMD = [
+        "ffmpeg", "-loglevel", "error",
+        "-f", "h264", "-framerate", str(CAMERA_FRAMERATE), "-i", "pipe:0",
+        "-c:v", "copy", "-f", "mp4",
+        "-movflags", "frag_keyframe+empty_moov+default_base_moof",
+        "pipe:1",
+    ]
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._init_segment: bytes | None = None
+        self._fragment: bytes | None = None
+        self._seq = 0
+        self._closed = False   # set once the muxer exits; clients then return
+        self._proc = subprocess.Popen(
+            self._FFMPEG_CMD, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+        self.output = FileOutput(self._proc.stdin)
+        threading.Thread(target=self._read_loop, daemon=True, name="H264Mux").start()
+
+    def _read_box(self) -> bytes | None:
+        """Read one top-level MP4 box from ffmpeg's stdout."""
+        stdout = self._proc.stdout
+        header = stdout.read(8)
+        if len(header) < 8:
+            return None
+        size = int.from_bytes(header[:4], "big")
+        if size == 1:   # 64-bit largesize follows the type field
+            ext = stdout.read(8)
+            header += ext
+            size = int.from_bytes(ext, "big")
+        body = stdout.read(size - len(header))
+        if len(body) < size - len(header):
+            return None   # truncated by EOF
+        return header + body
+
+    def _read_loop(self) -> None:
+        try:
+            self._mux_boxes()
+        except Exception as exc:
+            logger.warning(f"[Camera] H.264 muxer read failed: {exc}")
+        finally:
+            # Wake every waiting client so its response ends
+            with self._cond:
+                self._closed = True
+                self._cond.notify_all()
+
+    def _mux_boxes(self) -> None:
+        init = b""
+        pending = b""
+        while True:
+            box = self._read_box()
+            if box is None:
+                logger.warning("[Camera] H.264 muxer exited.")
+                return
+            kind = box[4:8]
+            if self._init_segment is None:
+                init += box
+                if kind == b"moov":
+                    with self._cond:
+                        self._init_segment = init
+                continue
+            pending += box
+            if kind == b"mdat":
+                with self._cond:
+                    self._fragment = pending
+                    self._seq += 1
+                    self._cond.notify_all()
+                pending = b""
+
+    def generate(self):
+        """
+        Yield the init segment, then each new fragment as it is produced.
+        Returns once the muxer has exited.
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._fragment is not None or self._closed)
+            if self._closed:
+                return
+            init, seq = self._init_segment, self._seq - 1
+        yield init
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._seq != seq or self._closed)
+                if self._closed:
+                    return
+                seq, fragment = self._seq, self._fragment
+            yield fragment
+
+    def close(self) -> None:
+        try:
+            self._proc.stdin.close()
+            self._proc.terminate()
+        except Exception:
+            pass
+
+
+class _JpegSink(io.BufferedIOBase):
+    """
+    File-like target for the hardware MJPEGEncoder. Each write() carries one
+    complete JPEG, which is handed straight to the frame publisher.
+    """
+
+    def __init__(self, publish):
+        self._publish = publish
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, buf) -> int:
+        self._publish(bytes(buf))
+        return len(buf)
+
 
 class CameraManager:
     """
-    Provides a thread-safe MJPEG frame source. Supports:
+    Provides a thread-safe MJPEG frame source and, when the Pi's hardware
+    encoder is available, a fragmented-MP4 H.264 stream. Supports:
       • Primary  — Raspberry Pi Camera Module (CSI)
       • Secondary — ESP32-CAM over HTTP (optional)
     """
 
     def __init__(self):
-        self._lock = threading.Lock()
-        self._frame: bytes | None = None
+        # Single-slot "latest frame only" holder: (sequence, jpeg_bytes).
+        # Readers always get the newest frame; older ones are simply dropped,
+        # which bounds a slow client's lag to one frame.
+        self._frame_cond = threading.Condition()
+        self._latest: tuple[int, bytes | None] = (0, None)
+        self._raw_frame = None       # newest un-annotated frame (for ML)
         self._camera = None
         self._available = False
         self._active_source = "primary"
         self._ml_overlay_fn = None   # Callable injected by ML module
         self._recording = False
         self._video_writer = None
+        self._rec_t0 = 0.0           # software recording: clock origin…
+        self._rec_frames = 0         # …and frames written since then
+        self._rec_queue: deque | None = None   # (frame, copies) for the encoder thread
+        self._rec_ready: threading.Event | None = None
+        self.version = 0             # bumped whenever get_status() would change
+        self._h264: _FragmentedMP4Stream | None = None
+        self._h264_encoder = None
+        self._rec_output = None      # CircularOutput teed off the H.264 encoder
+        self._rec_path: str | None = None
+        self._mjpeg_encoder = None
+        self._overlay_active = False # software-encoded overlay frames take over
+        self._tj = None
+
+        if TURBOJPEG_AVAILABLE:
+            try:
+                self._tj = TurboJPEG()
+            except Exception as exc:
+                logger.warning(f"[Camera] libturbojpeg not loadable — using OpenCV encoder: {exc}")
 
         self._init_primary()
 
@@ -65,6 +291,9 @@ class CameraManager:
         try:
             self._camera = Picamera2()
             config = self._camera.create_video_configuration(
+                # picamera2's "RGB888" is B,G,R in memory — exactly what OpenCV,
+                # TurboJPEG and the ML overlay expect, so no cvtColor is needed.
+                # ("BGR888" would be R,G,B in memory and reintroduce a swap.)
                 main={"size": CAMERA_RESOLUTION, "format": "RGB888"},
                 controls={"FrameRate": CAMERA_FRAMERATE},
             )
@@ -76,78 +305,303 @@ class CameraManager:
         except Exception as exc:
             logger.error(f"[Camera] Pi Camera init failed: {exc}")
             threading.Thread(target=self._test_pattern_loop, daemon=True).start()
+            return
+        self._init_h264()
+        self._init_mjpeg()
+
+    def _init_h264(self) -> None:
+        """Attach the hardware H.264 encoder to the running camera."""
+        if not H264_STREAM_ENABLED:
+            return
+        if shutil.which("ffmpeg") is None:
+            logger.warning("[Camera] ffmpeg not found — H.264 stream disabled, MJPEG only.")
+            return
+        try:
+            self._h264 = _FragmentedMP4Stream()
+            self._h264_encoder = H264Encoder(
+                bitrate=H264_BITRATE, iperiod=H264_I_FRAME_PERIOD, repeat=True
+            )
+            # Holds one GOP so a recording always starts on a keyframe
+            self._rec_output = CircularOutput(buffersize=H264_I_FRAME_PERIOD)
+            self._camera.start_encoder(
+                self._h264_encoder, [self._h264.output, self._rec_output]
+            )
+            logger.info("[Camera] Hardware H.264 stream started.")
+        except Exception as exc:
+            logger.warning(f"[Camera] H.264 stream unavailable — MJPEG only: {exc}")
+            if self._h264:
+                self._h264.close()
+            self._h264 = None
+            self._h264_encoder = None
+            self._rec_output = None
+
+    def _init_mjpeg(self) -> None:
+        """Attach the hardware MJPEG encoder so plain frames skip the CPU."""
+        if not MJPEG_HW_ENABLED:
+            return
+        try:
+            self._mjpeg_encoder = MJPEGEncoder(bitrate=MJPEG_BITRATE)
+            self._camera.start_encoder(
+                self._mjpeg_encoder, FileOutput(_JpegSink(self._publish_hw_frame))
+            )
+            logger.info("[Camera] Hardware MJPEG encoder started.")
+        except Exception as exc:
+            logger.warning(f"[Camera] Hardware MJPEG unavailable — software JPEG: {exc}")
+            self._mjpeg_encoder = None
+
+    def _publish_hw_frame(self, jpeg: bytes) -> None:
+        # While an ML overlay is drawn, the capture loop publishes the
+        # annotated software-encoded frames instead.
+        if not self._overlay_active:
+            self._publish_frame(jpeg)
 
     # ── Capture Loops ────────────────────────────────────────────────────────
 
     def _capture_loop(self) -> None:
+        # capture_array() blocks until the sensor delivers the next frame,
+        # so the camera's own FrameRate paces this loop.
+        pin_current_thread(CAPTURE_CPU, "Camera capture")
+        misses = 0
         while True:
             try:
-                frame_array = self._camera.capture_array()
+                raw = frame_array = self._camera.capture_array()
+            except Exception as exc:
+                misses += 1
+                if misses == _CAPTURE_WARN_MISSES:
+                    logger.warning(f"[Camera] {misses} captures failed in a row: {exc}")
+                else:
+                    logger.debug(f"[Camera] Capture error: {exc}")
+                time.sleep(1.0 / CAMERA_FRAMERATE)   # don't spin on a failing camera
+                continue
+            misses = 0
+            self._raw_frame = raw
+            try:
                 if self._ml_overlay_fn:
-                    frame_array = self._ml_overlay_fn(frame_array)
-                if CV2_AVAILABLE:
-                    _, jpeg = cv2.imencode(
-                        ".jpg", frame_array,
-                        [cv2.IMWRITE_JPEG_QUALITY, CAMERA_JPEG_QUALITY]
-                    )
-                    frame_bytes = jpeg.tobytes()
+                    frame_array = self._ml_overlay_fn(raw)
+                if self._mjpeg_encoder is None:
+                    self._publish_frame(self._encode_jpeg(frame_array))
                 else:
-                    import PIL.Image as PILImage
-                    img = PILImage.fromarray(frame_array)
-                    buf = io.BytesIO()
-                    img.save(buf, format="JPEG", quality=CAMERA_JPEG_QUALITY)
-                    frame_bytes = buf.getvalue()
+                    # Hardware encoder handles plain frames; only annotated
+                    # ones need a software encode.
+                    self._overlay_active = frame_array is not raw
+                    if self._overlay_active:
+                        self._publish_frame(self._encode_jpeg(frame_array))
+            except Exception as exc:
+                # An overlay or JPEG failure costs this frame's preview only
+                logger.debug(f"[Camera] Frame processing error: {exc}")
+                frame_array = raw
 
-                with self._lock:
-                    self._frame = frame_bytes
+            if self._recording and self._video_writer and CV2_AVAILABLE:
+                # The overlay buffer is reused next frame; raw frames are not
+                self._record_frame(frame_array, copy=frame_array is not raw)
 
-                if self._recording and self._video_writer and CV2_AVAILABLE:
-                    self._video_writer.write(frame_array)
+    def _record_frame(self, frame_array, copy: bool) -> None:
+        """
+        Queue the frame for the encoder as often as the recording clock is
+        due — none if it arrived early, more than once after a short stall —
+        so the clip plays back in real time even when capture drifts from
+        CAMERA_FRAMERATE.
+        """
+        due = int((time.monotonic() - self._rec_t0) * CAMERA_FRAMERATE) + 1
+        behind = due - self._rec_frames
+        if behind > _REC_MAX_REPEAT:
+            self._rec_frames = due - _REC_MAX_REPEAT
+            behind = _REC_MAX_REPEAT
+        if behind > 0:
+            self._rec_frames += behind
+            self._rec_queue.append((frame_array.copy() if copy else frame_array, behind))
+            self._rec_ready.set()
 
-            except Exception as exc:
-                logger.debug(f"[Camera] Capture error: {exc}")
-            time.sleep(1.0 / CAMERA_FRAMERATE)
+    @staticmethod
+    def _encode_loop(writer, filepath: str, frames: deque, ready: threading.Event,
+                     on_abort) -> None:
+        """
+        Encoder thread for software recording: drains the frame queue into
+        the VideoWriter so encode stalls never hold up capture, and releases
+        the writer once stop_recording() queues None. Every
+        RECORDING_SEGMENT_SEC it rotates to a new file: part 1 keeps the
+        plain ``<name>.mp4``, later parts are ``<name>_part02.mp4`` onwards.
+        If a segment cannot be opened, ``on_abort(frames)`` ends the recording.
+        """
+        stem, ext = os.path.splitext(filepath)
+        segment_frames = int(CAMERA_FRAMERATE * RECORDING_SEGMENT_SEC)
+        part, written, path = 1, 0, filepath
+        write = writer.write
+        while True:
+            ready.wait()
+            ready.clear()
+            while frames:
+                item = frames.popleft()
+                if item is None:
+                    writer.release()
+                    _finalise_recording(path)
+                    return
+                if segment_frames and written >= segment_frames:
+                    # Finalise the segment; capture keeps queueing meanwhile
+                    writer.release()
+                    _finalise_recording(path)
+                    part += 1
+                    path = f"{stem}_part{part:02d}{ext}"
+                    writer = _open_video_writer(_partial_path(path), CAMERA_RESOLUTION)
+                    if writer is None:
+                        logger.error(f"[Camera] Could not open segment {path}")
+                        on_abort(frames)
+                        return
+                    write, written = writer.write, 0
+                    logger.info(f"[Camera] Recording segment → {path}")
+                frame, copies = item
+                try:
+                    for _ in range(copies):
+                        write(frame)
+                except Exception as exc:
+                    logger.debug(f"[Camera] Recording write error: {exc}")
+                written += copies
+
+    def _abort_recording(self, frames: deque) -> None:
+        """Encoder-thread callback: end the recording that owns ``frames``."""
+        if self._recording and self._rec_queue is frames:
+            self._recording = False
+            self._video_writer = None
+            self.version += 1
+            logger.error("[Camera] Recording stopped — encoder could not continue.")
+
+    def _encode_jpeg(self, frame_array) -> bytes:
+        """Encode a BGR frame to JPEG, preferring libjpeg-turbo."""
+        if self._tj:
+            return self._tj.encode(
+                frame_array, quality=CAMERA_JPEG_QUALITY,
+                pixel_format=TJPF_BGR, jpeg_subsample=TJSAMP_420,
+            )
+        if CV2_AVAILABLE:
+            _, jpeg = cv2.imencode(
+                ".jpg", frame_array,
+                [cv2.IMWRITE_JPEG_QUALITY, CAMERA_JPEG_QUALITY]
+            )
+            return jpeg.tobytes()
+        import PIL.Image as PILImage
+        img = PILImage.fromarray(frame_array)
+        buf = io.BytesIO()
+        img.save(buf, format="JPEG", quality=CAMERA_JPEG_QUALITY)
+        return buf.getvalue()
 
     def _test_pattern_loop(self) -> None:
-        """Generate a grey test-card frame when no camera is present."""
+        """
+        Generate a test-card frame when no camera is present. Only the clock
+        changes, so the static card is drawn once and a new JPEG is encoded
+        once per second.
+        """
         if not CV2_AVAILABLE:
             return
         w, h = CAMERA_RESOLUTION
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        # Text anchors depend only on the resolution — measure once
+        (title_w, _), _ = cv2.getTextSize("NO CAMERA", font, 1.2, 2)
+        (clock_w, _), _ = cv2.getTextSize("00:00:00", font, 0.8, 1)
+        title_org = ((w - title_w) // 2, h // 2 - 20)
+        clock_org = ((w - clock_w) // 2, h // 2 + 30)
+
+        card = np.zeros((h, w, 3), dtype=np.uint8)
+        cv2.putText(card, "NO CAMERA", title_org, font, 1.2, (0, 200, 0), 2)
+        frame = np.empty_like(card)
+        last_ts = None
         while True:
-            frame = np.zeros((h, w, 3), dtype=np.uint8)
             ts = time.strftime("%H:%M:%S")
-            cv2.putText(frame, "NO CAMERA", (w // 2 - 100, h // 2 - 20),
-                        cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 200, 0), 2)
-            cv2.putText(frame, ts, (w // 2 - 50, h // 2 + 30),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 200, 0), 1)
-            _, jpeg = cv2.imencode(".jpg", frame)
-            with self._lock:
-                self._frame = jpeg.tobytes()
-            time.sleep(1.0 / 10)
+            if ts != last_ts:
+                np.copyto(frame, card)
+                cv2.putText(frame, ts, clock_org, font, 0.8, (0, 200, 0), 1)
+                self._publish_frame(self._encode_jpeg(frame))
+                last_ts = ts
+            # Wake just after the next second boundary
+            time.sleep(1.0 - time.time() % 1.0 + 0.01)
+
+    # ── Frame Access ─────────────────────────────────────────────────────────
+
+    def _publish_frame(self, frame_bytes: bytes) -> None:
+        with self._frame_cond:
+            self._latest = (self._latest[0] + 1, frame_bytes)
+            self._frame_cond.notify_all()
+
+    def peek_latest_raw(self):
+        """Return the newest un-annotated frame array without copying it."""
+        return self._raw_frame
+
+    def get_latest_jpeg(self) -> bytes | None:
+        """Return the most recently encoded JPEG frame (None before the first)."""
+        return self._latest[1]
+
+    def wait_for_frame(self, last_seq: int, timeout: float | None = None) -> tuple[int, bytes | None]:
+        """
+        Block until a frame newer than ``last_seq`` is published (or the
+        timeout expires) and return ``(seq, jpeg_bytes)`` for the newest one.
+        """
+        # _latest is swapped as one tuple reference, so a reader that is
+        # already behind can take it without touching the lock at all.
+        latest = self._latest
+        if latest[0] != last_seq:
+            return latest
+        with self._frame_cond:
+            self._frame_cond.wait_for(lambda: self._latest[0] != last_seq, timeout)
+            return self._latest
 
     # ── MJPEG Generator ──────────────────────────────────────────────────────
 
     def generate_frames(self):
         """Yield MJPEG multipart frames for Flask streaming response."""
+        last_seq = 0
         while True:
-            with self._lock:
-                frame = self._frame
+            last_seq, frame = self.wait_for_frame(last_seq)
             if frame:
-                yield (
-                    b"--frame\r\n"
-                    b"Content-Type: image/jpeg\r\n\r\n" + frame + b"\r\n"
-                )
-            time.sleep(1.0 / CAMERA_FRAMERATE)
+                # Yield the shared frame object itself — no per-client copy
+                yield _MJPEG_PART_HEADER
+                yield frame
+                yield _MJPEG_PART_TRAILER
+
+    # ── H.264 / fMP4 Generator ───────────────────────────────────────────────
+
+    @property
+    def h264_available(self) -> bool:
+        return self._h264 is not None
+
+    def generate_h264(self):
+        """Yield fragmented-MP4 chunks for a Flask ``video/mp4`` response."""
+        return self._h264.generate()
 
     # ── Recording ────────────────────────────────────────────────────────────
 
     def start_recording(self, filepath: str) -> bool:
-        if not CV2_AVAILABLE or self._recording:
+        """
+        Record to ``filepath`` (MP4). With the hardware encoder running, the
+        live H.264 bitstream is teed to disk — nothing is encoded twice — and
+        remuxed into MP4 when recording stops. Otherwise frames are encoded
+        with OpenCV on a dedicated encoder thread, split into segments of
+        RECORDING_SEGMENT_SEC.
+        """
+        if self._recording:
+            return False
+        if self._rec_output is not None:
+            self._rec_output.fileoutput = filepath + ".h264"
+            self._rec_output.start()
+            self._rec_path = filepath
+        elif CV2_AVAILABLE:
+            self._video_writer = _open_video_writer(_partial_path(filepath), CAMERA_RESOLUTION)
+            if self._video_writer is None:
+                logger.error(f"[Camera] No usable video codec for {filepath}")
+                return False
+            self._rec_t0, self._rec_frames = time.monotonic(), 0
+            self._rec_queue = deque(maxlen=_REC_QUEUE_LEN)
+            self._rec_ready = threading.Event()
+            # Not a daemon: queued frames are written and the file finalised
+            # even if the app is shutting down
+            threading.Thread(
+                target=self._encode_loop,
+                args=(self._video_writer, filepath, self._rec_queue, self._rec_ready,
+                      self._abort_recording),
+                name="RecordingEncoder",
+            ).start()
+        else:
             return False
-        w, h = CAMERA_RESOLUTION
-        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-        self._video_writer = cv2.VideoWriter(filepath, fourcc, CAMERA_FRAMERATE, (w, h))
         self._recording = True
+        self.version += 1
         logger.info(f"[Camera] Recording started → {filepath}")
         return True
 
@@ -155,16 +609,46 @@ class CameraManager:
         if not self._recording:
             return False
         self._recording = False
+        self.version += 1
+        if self._rec_path is not None:
+            self._rec_output.stop()
+            # Not a daemon: a remux in progress finishes before shutdown
+            threading.Thread(
+                target=self._remux_recording, args=(self._rec_path,),
+                name="RecordingRemux",
+            ).start()
+            self._rec_path = None
         if self._video_writer:
-            self._video_writer.release()
+            # The encoder thread owns the writer: it drains, then releases
             self._video_writer = None
+            self._rec_queue.append(None)
+            self._rec_ready.set()
         logger.info("[Camera] Recording stopped.")
         return True
 
+    @staticmethod
+    def _remux_recording(filepath: str) -> None:
+        """Wrap the raw H.264 recording in an MP4 container (stream copy)."""
+        raw = filepath + ".h264"
+        try:
+            subprocess.run(
+                ["ffmpeg", "-loglevel", "error", "-y",
+                 "-f", "h264", "-framerate", str(CAMERA_FRAMERATE), "-i", raw,
+                 "-c:v", "copy", _partial_path(filepath)],
+                check=True, timeout=600,
+            )
+            _finalise_recording(filepath)
+            os.remove(raw)
+        except Exception as exc:
+            logger.warning(f"[Camera] Could not remux {raw}: {exc}")
+
     # ── ML Overlay ───────────────────────────────────────────────────────────
 
     def set_ml_overlay(self, fn) -> None:
-        """Inject an ML overlay function (frame_array → annotated_frame_array)."""
+        """
+        Inject an ML overlay function (frame_array → annotated_frame_array).
+        It runs on the capture thread, so it must only draw — never infer.
+        """
         self._ml_overlay_fn = fn
 
     def clear_ml_overlay(self) -> None:
@@ -179,11 +663,19 @@ class CameraManager:
             "recording": self._recording,
             "resolution": CAMERA_RESOLUTION,
             "framerate": CAMERA_FRAMERATE,
+            "h264": self._h264 is not None,
             "esp32_cam_url": ESP32_CAM_URL,
         }
 
     def cleanup(self) -> None:
         self.stop_recording()
+        if self._h264 or self._mjpeg_encoder:
+            try:
+                self._camera.stop_encoder()   # stops every running encoder
+            except Exception:
+                pass
+        if self._h264:
+            self._h264.close()
         if self._camera:
             try:
                 self._camera.stop()
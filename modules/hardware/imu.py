@@ -12,8 +12,8 @@ import math
 import threading
 import time
 import logging
-from collections import deque
-from config import IMU_FLIP_THRESHOLD, IMU_TILT_THRESHOLD, MAX_MEMORY_LOGS
+from config import IMU_FLIP_THRESHOLD, IMU_TILT_THRESHOLD, MAX_MEMORY_LOGS, UI_HISTORY_LEN
+from modules.common.ring import HistoryRing
 
 logger = logging.getLogger(__name__)
 
@@ -40,50 +40,67 @@ class IMUMonitor:
         self.collision_detected: bool = False
         self._last_az: float  = 9.8   # ~1g
 
-        self.pitch_history: deque = deque(maxlen=MAX_MEMORY_LOGS)
-        self.roll_history:  deque = deque(maxlen=MAX_MEMORY_LOGS)
+        self.pitch_history = HistoryRing(MAX_MEMORY_LOGS)
+        self.roll_history  = HistoryRing(MAX_MEMORY_LOGS)
+
+        self.version: int = 0   # bumped whenever get_status() would change
+        self._status_cache: tuple[int, dict] | None = None   # (version, status)
 
         threading.Thread(target=self._poll_loop, daemon=True, name="IMUMonitor").start()
 
     # ── Polling ─────────────────────────────────────────────────────────────
 
     def _poll_loop(self) -> None:
+        arduino = self._arduino
         while True:
-            if self._arduino.servo_connected:
-                data = self._arduino.get_imu_data()
-                with self._lock:
-                    self.pitch = data["pitch"]
-                    self.roll  = data["roll"]
-                    self.yaw   = data["yaw"]
-                    self.ax    = data["ax"]
-                    self.ay    = data["ay"]
-                    self.az    = data["az"]
-
-                    self.is_flipped = abs(self.pitch) > IMU_FLIP_THRESHOLD or \
-                                      abs(self.roll)  > IMU_FLIP_THRESHOLD
-
-                    self.is_tilted  = abs(self.pitch) > IMU_TILT_THRESHOLD or \
-                                      abs(self.roll)  > IMU_TILT_THRESHOLD
-
-                    # Detect sudden jolt (collision) via Z-axis spike
-                    delta_az = abs(self.az - self._last_az)
-                    self.collision_detected = delta_az > 4.0
-                    self._last_az = self.az
-
-                    self.pitch_history.append(round(self.pitch, 1))
-                    self.roll_history.append(round(self.roll, 1))
-
-                    if self.is_flipped:
-                        logger.warning("[IMU] FLIP DETECTED — motors should be disabled.")
-                    if self.collision_detected:
-                        logger.warning("[IMU] COLLISION DETECTED.")
-            time.sleep(0.1)
+            if not arduino.servo_connected:
+                time.sleep(0.1)
+                continue
+            # The servo firmware streams samples; wake on each one. If none
+            # arrives in time (older firmware), ask for a reading instead.
+            if not arduino.imu_event.wait(timeout=0.2):
+                arduino.send_servo_command("IMU")
+                continue
+            arduino.imu_event.clear()
+            data = arduino.latest_imu
+            with self._lock:
+                self.pitch = data["pitch"]
+                self.roll  = data["roll"]
+                self.yaw   = data["yaw"]
+                self.ax    = data["ax"]
+                self.ay    = data["ay"]
+                self.az    = data["az"]
+
+                self.is_flipped = abs(self.pitch) > IMU_FLIP_THRESHOLD or \
+                                  abs(self.roll)  > IMU_FLIP_THRESHOLD
+
+                self.is_tilted  = abs(self.pitch) > IMU_TILT_THRESHOLD or \
+                                  abs(self.roll)  > IMU_TILT_THRESHOLD
+
+                # Detect sudden jolt (collision) via Z-axis spike
+                delta_az = abs(self.az - self._last_az)
+                self.collision_detected = delta_az > 4.0
+                self._last_az = self.az
+
+                self.pitch_history.append(round(self.pitch, 1))
+                self.roll_history.append(round(self.roll, 1))
+
+                if self.is_flipped:
+                    logger.warning("[IMU] FLIP DETECTED — motors should be disabled.")
+                if self.collision_detected:
+                    logger.warning("[IMU] COLLISION DETECTED.")
+                # Every sample extends the histories, so the status changes
+                self.version += 1
 
     # ── Public API ──────────────────────────────────────────────────────────
 
     def get_status(self) -> dict:
+        """Status dict, rebuilt only when ``version`` moves (treat as read-only)."""
+        cached = self._status_cache
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
         with self._lock:
-            return {
+            status = {
                 "pitch": round(self.pitch, 1),
                 "roll":  round(self.roll, 1),
                 "yaw":   round(self.yaw, 1),
@@ -93,6 +110,8 @@ class IMUMonitor:
                 "is_flipped": self.is_flipped,
                 "is_tilted":  self.is_tilted,
                 "collision":  self.collision_detected,
-                "pitch_history": list(self.pitch_history)[-60:],
-                "roll_history":  list(self.roll_history)[-60:],
+                "pitch_history": self.pitch_history.latest(UI_HISTORY_LEN),
+                "roll_history":  self.roll_history.latest(UI_HISTORY_LEN),
             }
+            self._status_cache = (self.version, status)
+        return status
@@ -13,6 +13,7 @@ import time
 import logging
 from config import (
     LED_PIN, LED_COUNT, LED_BRIGHTNESS, LED_FREQ_HZ, LED_DMA, LED_INVERT,
+    LED_RENDER_HZ,
     LED_COLOR_IDLE, LED_COLOR_MOVING, LED_COLOR_AUTONOMOUS,
     LED_COLOR_RECORDING, LED_COLOR_WARN, LED_COLOR_CRITICAL,
     LED_COLOR_NIGHT, LED_COLOR_ML, LED_COLOR_OFF
@@ -21,7 +22,7 @@ from config import (
 logger = logging.getLogger(__name__)
 
 try:
-    from rpi_ws281x import PixelStrip, Color
+    from rpi_ws281x import PixelStrip
     WS281X_AVAILABLE = True
 except ImportError:
     WS281X_AVAILABLE = False
@@ -43,6 +44,22 @@ MODE_COLORS = {
 }
 
 
+def _pack(r: int, g: int, b: int) -> int:
+    """Pack an RGB triple into the strip's 24-bit colour word (same as Color())."""
+    return (r << 16) | (g << 8) | b
+
+
+# MODE_COLORS packed once at import, so mode changes don't re-pack
+MODE_COLORS_PACKED = {mode: _pack(*rgb) for mode, rgb in MODE_COLORS.items()}
+
+
+# Night mode: front half white headlights, rear half dim red tail-lights
+_NIGHT_FRAME = (
+    [_pack(255, 255, 255)] * (LED_COUNT // 2)
+    + [_pack(80, 0, 0)] * (LED_COUNT - LED_COUNT // 2)
+)
+
+
 class LEDController:
     """
     Controls the WS2812B LED strip. Supports solid colours, blinking,
@@ -54,9 +71,18 @@ class LEDController:
         self._available = False
         self._lock = threading.Lock()
         self._current_mode = "IDLE"
-        self._blink_thread: threading.Thread | None = None
-        self._blink_active = False
+        # (packed colour, half-period) of the active blink, or None. One
+        # animation thread ticks it; set_mode only swaps the tuple.
+        self._blink: tuple[int, float] | None = None
+        self._anim_cv = threading.Condition()
         self._night_mode = False
+        self.version = 0   # bumped whenever get_status() would change
+        # Framebuffer of packed colours. Writers only update it and set
+        # _dirty; the render thread pushes it to the strip at most
+        # LED_RENDER_HZ times a second.
+        self._frame = [0] * LED_COUNT
+        self._dirty = threading.Event()
+        self._fill: int | None = None   # colour of the whole frame, if uniform
 
         if WS281X_AVAILABLE:
             try:
@@ -67,43 +93,79 @@ class LEDController:
                 self._strip.begin()
                 self._available = True
                 logger.info("[LED] WS2812B strip initialised.")
+                threading.Thread(
+                    target=self._render_loop, daemon=True, name="LEDRender"
+                ).start()
+                threading.Thread(
+                    target=self._animation_loop, daemon=True, name="LEDAnimation"
+                ).start()
                 self.set_mode("IDLE")
             except Exception as exc:
                 logger.warning(f"[LED] Strip init failed: {exc}")
 
     # ── Core Primitives ─────────────────────────────────────────────────────
 
-    def _set_all(self, r: int, g: int, b: int) -> None:
+    def _set_all(self, packed: int) -> None:
         if not self._available:
             return
         with self._lock:
-            for i in range(LED_COUNT):
-                self._strip.setPixelColor(i, Color(r, g, b))
-            self._strip.show()
+            if self._fill == packed:
+                return   # already showing it — skip the copy and the show()
+            self._frame[:] = [packed] * LED_COUNT
+            self._fill = packed
+        self._dirty.set()
 
     def _set_pixel(self, index: int, r: int, g: int, b: int) -> None:
         if not self._available:
             return
         with self._lock:
-            self._strip.setPixelColor(index, Color(r, g, b))
-            self._strip.show()
+            self._frame[index] = _pack(r, g, b)
+            self._fill = None
+        self._dirty.set()
+
+    def _render_loop(self) -> None:
+        """Push the framebuffer to the strip whenever it changed, rate-limited."""
+        interval = 1.0 / LED_RENDER_HZ
+        while True:
+            self._dirty.wait()
+            started = time.time()
+            with self._lock:
+                self._dirty.clear()
+                frame = list(self._frame)
+            try:
+                # One slice assignment into the strip buffer, then one show()
+                self._strip._led_data[:] = frame
+                self._strip.show()
+            except Exception as exc:
+                logger.debug(f"[LED] Render error: {exc}")
+            remaining = interval - (time.time() - started)
+            if remaining > 0:
+                time.sleep(remaining)
 
     # ── Blink Engine ────────────────────────────────────────────────────────
 
+    def _set_blink(self, blink: tuple[int, float] | None) -> None:
+        with self._anim_cv:
+            self._blink = blink
+            self._anim_cv.notify_all()
+
     def _stop_blink(self) -> None:
-        self._blink_active = False
-        if self._blink_thread and self._blink_thread.is_alive():
-            self._blink_thread.join(timeout=1.0)
-
-    def _blink_loop(self, r: int, g: int, b: int, interval: float) -> None:
-        state = True
-        while self._blink_active:
-            if state:
-                self._set_all(r, g, b)
-            else:
-                self._set_all(0, 0, 0)
-            state = not state
-            time.sleep(interval)
+        self._set_blink(None)
+
+    def _animation_loop(self) -> None:
+        with self._anim_cv:
+            last, on = None, False
+            while True:
+                blink = self._blink
+                if blink is None:
+                    last = None
+                    self._anim_cv.wait()
+                    continue
+                if blink is not last:
+                    last, on = blink, False   # new blink starts on the lit phase
+                on = not on
+                self._set_all(blink[0] if on else 0)
+                self._anim_cv.wait(blink[1])
 
     # ── Public API ──────────────────────────────────────────────────────────
 
@@ -111,27 +173,19 @@ class LEDController:
         mode = mode.upper()
         self._stop_blink()
         self._current_mode = mode
-        color = MODE_COLORS.get(mode, LED_COLOR_IDLE)
-        r, g, b = color
+        self.version += 1
+        packed = MODE_COLORS_PACKED.get(mode, MODE_COLORS_PACKED["IDLE"])
 
         if mode == "CRITICAL":
             # Fast blink red for critical alerts
-            self._blink_active = True
-            self._blink_thread = threading.Thread(
-                target=self._blink_loop, args=(r, g, b, 0.25), daemon=True
-            )
-            self._blink_thread.start()
+            self._set_blink((packed, 0.25))
         elif mode == "WARN":
             # Slow blink amber for warnings
-            self._blink_active = True
-            self._blink_thread = threading.Thread(
-                target=self._blink_loop, args=(r, g, b, 0.75), daemon=True
-            )
-            self._blink_thread.start()
+            self._set_blink((packed, 0.75))
         elif mode == "NIGHT":
             self._apply_night_mode()
         else:
-            self._set_all(r, g, b)
+            self._set_all(packed)
 
         logger.debug(f"[LED] Mode set to {mode}")
 
@@ -139,20 +193,18 @@ class LEDController:
         """Front half of strip = white headlights, rear = dim red tail-lights."""
         if not self._available:
             return
-        half = LED_COUNT // 2
         with self._lock:
-            for i in range(half):
-                self._strip.setPixelColor(i, Color(255, 255, 255))
-            for i in range(half, LED_COUNT):
-                self._strip.setPixelColor(i, Color(80, 0, 0))
-            self._strip.show()
+            self._frame[:] = _NIGHT_FRAME
+            self._fill = None
+        self._dirty.set()
 
     def set_custom_color(self, r: int, g: int, b: int) -> None:
         self._stop_blink()
-        self._set_all(r, g, b)
+        self._set_all(_pack(r, g, b))
 
     def toggle_night_mode(self) -> bool:
         self._night_mode = not self._night_mode
+        self.version += 1
         if self._night_mode:
             self.set_mode("NIGHT")
         else:
@@ -161,7 +213,7 @@ class LEDController:
 
     def off(self) -> None:
         self._stop_blink()
-        self._set_all(0, 0, 0)
+        self._set_all(0)
 
     def get_status(self) -> dict:
         return {
@@ -173,3 +225,9 @@ class LEDController:
     def cleanup(self) -> None:
         self._stop_blink()
         self.off()
+        if self._available:
+            # Render the final blank frame now; the daemon render thread may
+            # not get another turn before the process exits.
+            with self._lock:
+                self._strip._led_data[:] = self._frame
+                self._strip.show()
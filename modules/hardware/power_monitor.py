@@ -11,12 +11,13 @@ Falls back gracefully when the sensor is not present (e.g., dev environment).
 import time
 import threading
 import logging
-from collections import deque
 from config import (
     INA219_I2C_ADDRESS, BATTERY_FULL_VOLTAGE, BATTERY_EMPTY_VOLTAGE,
     BATTERY_WARN_PERCENT, BATTERY_CRITICAL_PERCENT, SHUNT_OHMS,
-    MAX_MEMORY_LOGS
+    POWER_SAMPLE_INTERVAL, POWER_ALERT_INTERVAL,
+    MAX_MEMORY_LOGS, UI_HISTORY_LEN
 )
+from modules.common.ring import HistoryRing
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,10 @@ except ImportError:
     INA219_AVAILABLE = False
     logger.warning("[Power] ina219 library not found — using simulated data.")
 
+# Battery % per volt above empty, folded once so each sample is one multiply
+_SPAN = BATTERY_FULL_VOLTAGE - BATTERY_EMPTY_VOLTAGE
+_PERCENT_PER_VOLT = 100.0 / _SPAN if _SPAN > 0 else 0.0
+
 
 class PowerMonitor:
     """
@@ -46,12 +51,14 @@ class PowerMonitor:
         self.battery_percent: float = 100.0
 
         # Rolling history (for UI sparkline charts)
-        self.voltage_history: deque = deque(maxlen=MAX_MEMORY_LOGS)
-        self.current_history: deque = deque(maxlen=MAX_MEMORY_LOGS)
-        self.power_history: deque = deque(maxlen=MAX_MEMORY_LOGS)
+        self.voltage_history = HistoryRing(MAX_MEMORY_LOGS)
+        self.current_history = HistoryRing(MAX_MEMORY_LOGS)
+        self.power_history   = HistoryRing(MAX_MEMORY_LOGS)
 
         # Alert state
         self.alert_level: str = "OK"   # OK | WARN | CRITICAL
+        self.version: int = 0          # bumped whenever get_status() would change
+        self._status_cache: tuple[int, dict] | None = None   # (version, status)
 
         self._init_sensor()
         threading.Thread(target=self._sample_loop, daemon=True, name="PowerMonitor").start()
@@ -73,9 +80,11 @@ class PowerMonitor:
     # ── Sampling Loop ───────────────────────────────────────────────────────
 
     def _sample_loop(self) -> None:
+        # Slow I²C polling while the battery is healthy; speed up near empty
+        # so CRITICAL is caught quickly
         while True:
             self._read()
-            time.sleep(1.0)
+            time.sleep(POWER_SAMPLE_INTERVAL if self.alert_level == "OK" else POWER_ALERT_INTERVAL)
 
     def _read(self) -> None:
         if self._available and self._sensor:
@@ -100,15 +109,15 @@ class PowerMonitor:
             self.current_history.append(round(self.current_ma, 1))
             self.power_history.append(round(self.power_mw, 1))
             self._update_alert()
+            self.version += 1
 
     # ── Helpers ─────────────────────────────────────────────────────────────
 
     def _voltage_to_percent(self, voltage: float) -> float:
-        span = BATTERY_FULL_VOLTAGE - BATTERY_EMPTY_VOLTAGE
-        if span <= 0:
+        if not _PERCENT_PER_VOLT:
             return 100.0
-        pct = (voltage - BATTERY_EMPTY_VOLTAGE) / span * 100.0
-        return max(0.0, min(100.0, round(pct, 1)))
+        pct = (voltage - BATTERY_EMPTY_VOLTAGE) * _PERCENT_PER_VOLT
+        return 0.0 if pct < 0.0 else 100.0 if pct > 100.0 else round(pct, 1)
 
     def _update_alert(self) -> None:
         if self.battery_percent <= BATTERY_CRITICAL_PERCENT:
@@ -121,14 +130,20 @@ class PowerMonitor:
     # ── Public API ──────────────────────────────────────────────────────────
 
     def get_status(self) -> dict:
+        """Status dict, rebuilt only when ``version`` moves (treat as read-only)."""
+        cached = self._status_cache
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
         with self._lock:
-            return {
+            status = {
                 "available": self._available or not INA219_AVAILABLE,
                 "voltage": round(self.voltage, 2),
                 "current_ma": round(self.current_ma, 1),
                 "power_mw": round(self.power_mw, 1),
                 "battery_percent": self.battery_percent,
                 "alert_level": self.alert_level,
-                "voltage_history": list(self.voltage_history)[-60:],
-                "current_history": list(self.current_history)[-60:],
+                "voltage_history": self.voltage_history.latest(UI_HISTORY_LEN),
+                "current_history": self.current_history.latest(UI_HISTORY_LEN),
             }
+            self._status_cache = (self.version, status)
+        return status
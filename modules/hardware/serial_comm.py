@@ -10,17 +10,187 @@ continues operating and the system alerts the user rather than crashing.
 
 import serial
 import serial.tools.list_ports
+import struct
 import threading
 import time
 import queue
 import logging
+import selectors
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 from config import (
-    BAUD_RATE, SERIAL_TIMEOUT, RECONNECT_INTERVAL, MAX_RECONNECT_TRIES
+    BAUD_RATE, SERIAL_TIMEOUT, SERIAL_WRITE_TIMEOUT, RECONNECT_INTERVAL, MAX_RECONNECT_TRIES,
+    SENSOR_POLL_HZ, SENSOR_STALE_AFTER, MOTOR_REPEAT_INTERVAL, MOTOR_USB_SERIAL, SERVO_USB_SERIAL,
 )
 
 logger = logging.getLogger(__name__)
 
+# Queued commands that share a coalescing key supersede each other — only the
+# latest drive direction, speed, LED state or per-servo angle matters.
+_MOTION_COMMANDS = frozenset({"FORWARD", "BACKWARD", "LEFT", "RIGHT", "STOP", "SLOW"})
+_COALESCE_PREFIXES = {
+    "SEQ": "MOTION", "SPEED": "SPEED", "LED": "LED", "LEDC": "LED",
+    "S1": "S1", "S2": "S2", "S3": "S3", "S4": "S4",
+}
+# Wire bytes for the fixed commands, encoded once; parameterised commands
+# (SPEED:, S1:, LEDC:, SEQ:, ...) are encoded per send
+_ENCODED = {
+    cmd: f"{cmd}\n".encode()
+    for cmd in (*_MOTION_COMMANDS, "DA", "DF", "DL", "DR", "?", "IMU", "CENTER", "SCAN")
+}
+_RX_LIMIT = 1024            # bytes — drop unframed input beyond this
+_LOG_RING_LEN = 256         # reply lines kept per port for UI scrollback
+_TELEM_INTERVAL = 0.02      # seconds — firmware TELEM_INTERVAL between T: frames
+_STATUS_MAX_AGE = 5 * _TELEM_INTERVAL   # older streamed status falls back to "?"
+
+# USB vendor IDs of Arduino boards and the USB-serial bridges on clones
+# (Arduino LLC, Arduino SRL, WCH CH340, FTDI, Silicon Labs CP210x)
+_ARDUINO_VIDS = frozenset({0x2341, 0x2A03, 0x1A86, 0x0403, 0x10C4})
+
+# Binary IMU frame from the servo firmware: 0xAA 0x55, five little-endian
+# float32 (pitch, roll, ax, ay, az), then an 8-bit sum of the payload
+_IMU_SYNC = b"\xaa\x55"
+_IMU_PAYLOAD = struct.Struct("<5f")
+_IMU_FRAME_LEN = 2 + _IMU_PAYLOAD.size + 1
+
+
+# Ultrasonic readings in cm (0 = no echo); one immutable triple per update
+Distances = namedtuple("Distances", "front left right")
+
+
+def _parse_imu(raw: str) -> dict | None:
+    """
+    Parse a text ``IMU:`` line from older servo firmware: pitch,roll,ax,ay,az,
+    or the six-field pitch,roll,yaw,ax,ay,az form.
+    """
+    try:
+        values = [float(v) for v in raw[4:].split(",")]
+    except ValueError:
+        return None
+    if len(values) == 5:
+        values.insert(2, 0.0)   # no yaw from the MPU-6050 firmware
+    if len(values) != 6:
+        return None
+    return dict(zip(("pitch", "roll", "yaw", "ax", "ay", "az"), values))
+
+
+def _probe_port(device: str) -> str | None:
+    """Open ``device``, wait out the Arduino reset and read its READY banner."""
+    try:
+        with serial.Serial(device, BAUD_RATE, timeout=2) as ser:
+            time.sleep(2)
+            if ser.in_waiting > 0:
+                msg = ser.readline().decode("utf-8", errors="ignore").strip()
+                if "MOTOR_READY" in msg:
+                    return "motor"
+                if "SERVO_READY" in msg:
+                    return "servo"
+    except Exception as exc:
+        logger.warning(f"[Serial] Could not probe {device}: {exc}")
+    return None
+
+
+def _coalesce_key(command: str) -> str | None:
+    if command in _MOTION_COMMANDS:
+        return "MOTION"
+    head, sep, _ = command.partition(":")
+    return _COALESCE_PREFIXES.get(head) if sep else None
+
+
+class _Mailboxes:
+    """
+    Latest reply line per message prefix (``STATUS``, ``DIST_ALL``, ...) for
+    one port. Queries wait on their prefix's event, so unrelated messages
+    are never drained or lost, and one slot per prefix keeps it bounded.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latest: dict[str, str] = {}
+        self._events: dict[str, threading.Event] = {}
+
+    def post(self, raw: str) -> None:
+        prefix = raw.partition(":")[0]
+        with self._lock:
+            self._latest[prefix] = raw
+            event = self._events.get(prefix)
+        if event is not None:
+            event.set()
+
+    def arm(self, prefix: str) -> threading.Event:
+        """Forget the last ``prefix`` reply; call before sending the query."""
+        with self._lock:
+            event = self._events.setdefault(prefix, threading.Event())
+            self._latest.pop(prefix, None)
+            event.clear()
+        return event
+
+    def take(self, prefix: str, event: threading.Event, timeout: float) -> str | None:
+        if not event.wait(timeout):
+            return None
+        with self._lock:
+            return self._latest.get(prefix)
+
+
+def _set_low_latency(ser: serial.Serial) -> None:
+    """
+    Set ASYNC_LOW_LATENCY on the tty so USB-serial adapters (FTDI, CH340)
+    hand over bytes immediately instead of after their 16 ms latency timer.
+    Not every driver supports it; failure only costs latency.
+    """
+    try:
+        ser.set_low_latency_mode(True)
+    except (AttributeError, ValueError, OSError) as exc:
+        logger.debug(f"[Serial] Low-latency mode unavailable on {ser.port}: {exc}")
+
+
+class _SerialChannel:
+    """
+    One Arduino link: the port, its connection state, the write lock, the
+    reply mailboxes, the listener's receive buffer and a ring of recent
+    reply lines. ``parse`` is called by the listener with ``rx`` after new
+    bytes are appended.
+    """
+
+    def __init__(self, name: str, port: str | None, parse):
+        self.name = name                     # "motor" / "servo"
+        self.label = name.title()            # log prefix
+        self.port = port
+        self.serial: serial.Serial | None = None
+        self.connected = False
+        self.reconnect_count = 0
+        self.lock = threading.Lock()
+        self.mail = _Mailboxes()
+        self.rx = bytearray()
+        self.recent: deque[str] = deque(maxlen=_LOG_RING_LEN)
+        self.parse = parse
+
+    def connect(self) -> bool:
+        if not self.port:
+            logger.warning(f"[Serial] {self.label} port not specified — {self.name} features disabled.")
+            return False
+        try:
+            self.serial = serial.Serial(self.port, BAUD_RATE, timeout=SERIAL_TIMEOUT,
+                                        write_timeout=SERIAL_WRITE_TIMEOUT)
+            _set_low_latency(self.serial)
+            time.sleep(2)
+            self.connected = True
+            self.reconnect_count = 0
+            logger.info(f"[Serial] {self.label} controller connected on {self.port}")
+        except Exception as exc:
+            logger.error(f"[Serial] {self.label} connection failed: {exc}")
+            self.connected = False
+        return self.connected
+
+    def close(self) -> None:
+        self.connected = False
+        if self.serial:
+            try:
+                self.serial.close()
+            except Exception:
+                pass
+
 
 class ArduinoController:
     """
@@ -32,91 +202,110 @@ class ArduinoController:
     """
 
     def __init__(self, motor_port: str = None, servo_port: str = None):
-        self._baud = BAUD_RATE
-        self._timeout = SERIAL_TIMEOUT
-
-        self.motor_serial: serial.Serial | None = None
-        self.servo_serial: serial.Serial | None = None
-        self.motor_connected = False
-        self.servo_connected = False
-
-        self._motor_lock = threading.Lock()
-        self._servo_lock = threading.Lock()
-        self._motor_responses: queue.Queue = queue.Queue()
-        self._servo_responses: queue.Queue = queue.Queue()
-
-        self._motor_reconnect_count = 0
-        self._servo_reconnect_count = 0
+        self._tx: queue.Queue = queue.Queue()   # (channel, (command, ...)) for the writer
+        # Latest ultrasonic readings; replaced wholesale on every T: frame from
+        # the motor listener (or DA reply from the poller), with
+        # _distance_cond notified after each update. _distances_at is the
+        # monotonic time of that update (0 = never)
+        self._distances = Distances(0, 0, 0)
+        self._distances_at = 0.0
+        # (monotonic ts, status) from the same T: frames, swapped as one tuple
+        self._motor_status: tuple[float, dict] | None = None
+        self._distance_cond = threading.Condition()
+        # Latest IMU sample, pushed by the servo listener as IMU frames
+        # arrive; imu_event is set on every new sample
+        self.latest_imu = {"pitch": 0.0, "roll": 0.0, "yaw": 0.0, "ax": 0.0, "ay": 0.0, "az": 0.0}
+        self.imu_event = threading.Event()
+        # Last command sent, to drop key-repeat floods from the UI
+        self._last_motor: dict[str, tuple[str, float]] = {}   # key → (cmd, ts)
+        self._last_servo_angles: dict[str, int] = {}
 
         # Attempt initial connection
         if motor_port is None or servo_port is None:
             motor_port, servo_port = self._auto_detect_ports()
 
-        self._motor_port = motor_port
-        self._servo_port = servo_port
-        self._connect_motor(motor_port)
-        self._connect_servo(servo_port)
+        self.motor = _SerialChannel("motor", motor_port, self._drain_motor_buffer)
+        self.servo = _SerialChannel("servo", servo_port, self._drain_servo_buffer)
+        self._channels = (self.motor, self.servo)
+        for channel in self._channels:
+            self._connect(channel)
 
         # Start listener and watchdog threads
-        threading.Thread(target=self._listen_motor, daemon=True, name="MotorListener").start()
-        threading.Thread(target=self._listen_servo, daemon=True, name="ServoListener").start()
+        threading.Thread(target=self._listen, daemon=True, name="SerialListener").start()
         threading.Thread(target=self._watchdog, daemon=True, name="SerialWatchdog").start()
+        threading.Thread(target=self._writer, daemon=True, name="SerialWriter").start()
+        threading.Thread(target=self._poll_distances, daemon=True, name="DistancePoller").start()
+
+    # Read-only views kept for callers that predate the channels
+    @property
+    def motor_connected(self) -> bool:
+        return self.motor.connected
+
+    @property
+    def servo_connected(self) -> bool:
+        return self.servo.connected
+
+    @property
+    def motor_serial(self) -> serial.Serial | None:
+        return self.motor.serial
+
+    @property
+    def servo_serial(self) -> serial.Serial | None:
+        return self.servo.serial
 
     # ── Port Detection ──────────────────────────────────────────────────────
 
     def _auto_detect_ports(self) -> tuple[str | None, str | None]:
-        """Probe all USB serial ports for MOTOR_READY / SERVO_READY handshakes."""
+        """
+        Match boards by USB serial number when configured; otherwise probe
+        the Arduino-looking ports for MOTOR_READY / SERVO_READY handshakes,
+        all in parallel so the 2 s reset waits overlap.
+        """
         logger.info("[Serial] Auto-detecting Arduino ports…")
-        ports = [p for p in serial.tools.list_ports.comports()
-                 if "USB" in p.description or "ACM" in p.device]
-
-        motor_port = servo_port = None
-        for port in ports:
-            try:
-                with serial.Serial(port.device, self._baud, timeout=2) as ser:
-                    time.sleep(2)
-                    if ser.in_waiting > 0:
-                        msg = ser.readline().decode("utf-8", errors="ignore").strip()
-                        if "MOTOR_READY" in msg:
-                            motor_port = port.device
-                            logger.info(f"[Serial] Motor controller → {port.device}")
-                        elif "SERVO_READY" in msg:
-                            servo_port = port.device
-                            logger.info(f"[Serial] Servo controller → {port.device}")
-            except Exception as exc:
-                logger.warning(f"[Serial] Could not probe {port.device}: {exc}")
+        ports = serial.tools.list_ports.comports()
+        by_serial = {p.serial_number: p.device for p in ports if p.serial_number}
+        motor_port = by_serial.get(MOTOR_USB_SERIAL) if MOTOR_USB_SERIAL else None
+        servo_port = by_serial.get(SERVO_USB_SERIAL) if SERVO_USB_SERIAL else None
+        for role, device in (("Motor", motor_port), ("Servo", servo_port)):
+            if device:
+                logger.info(f"[Serial] {role} controller → {device} (USB serial number)")
+        if motor_port and servo_port:
+            return motor_port, servo_port
+
+        unclaimed = [p for p in ports if p.device not in (motor_port, servo_port)]
+        candidates = [p.device for p in unclaimed if p.vid in _ARDUINO_VIDS] or \
+                     [p.device for p in unclaimed if "USB" in p.description or "ACM" in p.device]
+        if not candidates:
+            return motor_port, servo_port
+        with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+            for device, role in zip(candidates, pool.map(_probe_port, candidates)):
+                if role == "motor" and motor_port is None:
+                    motor_port = device
+                    logger.info(f"[Serial] Motor controller → {device}")
+                elif role == "servo" and servo_port is None:
+                    servo_port = device
+                    logger.info(f"[Serial] Servo controller → {device}")
 
         return motor_port, servo_port
 
     # ── Connection Helpers ──────────────────────────────────────────────────
 
-    def _connect_motor(self, port: str | None) -> None:
-        if not port:
-            logger.warning("[Serial] Motor port not specified — motor features disabled.")
-            return
-        try:
-            self.motor_serial = serial.Serial(port, self._baud, timeout=self._timeout)
-            time.sleep(2)
-            self.motor_connected = True
-            self._motor_reconnect_count = 0
-            logger.info(f"[Serial] Motor controller connected on {port}")
-        except Exception as exc:
-            logger.error(f"[Serial] Motor connection failed: {exc}")
-            self.motor_connected = False
+    def _connect(self, channel: _SerialChannel) -> None:
+        # Opening the port resets the Arduino, so nothing sent before counts
+        self._forget_sent(channel)
+        if channel.connect() and channel is self.motor:
+            self._motor_status = None   # until this firmware's first T: frame
 
-    def _connect_servo(self, port: str | None) -> None:
-        if not port:
-            logger.warning("[Serial] Servo port not specified — servo features disabled.")
-            return
-        try:
-            self.servo_serial = serial.Serial(port, self._baud, timeout=self._timeout)
-            time.sleep(2)
-            self.servo_connected = True
-            self._servo_reconnect_count = 0
-            logger.info(f"[Serial] Servo controller connected on {port}")
-        except Exception as exc:
-            logger.error(f"[Serial] Servo connection failed: {exc}")
-            self.servo_connected = False
+    def _link_lost(self, channel: _SerialChannel) -> None:
+        channel.connected = False
+        self._forget_sent(channel)
+
+    def _forget_sent(self, channel: _SerialChannel) -> None:
+        """Clear the dedup caches, so the next command is always sent."""
+        if channel is self.motor:
+            self._last_motor.clear()
+        else:
+            self._last_servo_angles.clear()
 
     # ── Watchdog (auto-reconnect) ───────────────────────────────────────────
 
@@ -124,155 +313,351 @@ class ArduinoController:
         """Periodically attempt to reconnect disconnected Arduinos."""
         while True:
             time.sleep(RECONNECT_INTERVAL)
-            if not self.motor_connected and self._motor_reconnect_count < MAX_RECONNECT_TRIES:
-                logger.info("[Serial] Attempting motor reconnect…")
-                self._motor_reconnect_count += 1
-                self._connect_motor(self._motor_port)
-
-            if not self.servo_connected and self._servo_reconnect_count < MAX_RECONNECT_TRIES:
-                logger.info("[Serial] Attempting servo reconnect…")
-                self._servo_reconnect_count += 1
-                self._connect_servo(self._servo_port)
+            for channel in self._channels:
+                if not channel.connected and channel.reconnect_count < MAX_RECONNECT_TRIES:
+                    logger.info(f"[Serial] Attempting {channel.name} reconnect…")
+                    channel.reconnect_count += 1
+                    self._connect(channel)
 
     # ── Listener Threads ───────────────────────────────────────────────────
 
-    def _listen_motor(self) -> None:
+    def _listen(self) -> None:
+        """
+        One thread for both ports: block in the selector until either fd is
+        readable, read what is waiting, and hand it to the channel's parser.
+        """
+        sel = selectors.DefaultSelector()
+        registered: dict[_SerialChannel, tuple] = {}   # channel → (serial, fd)
         while True:
-            if self.motor_connected and self.motor_serial:
+            # Follow (re)connects and drops
+            for channel in self._channels:
+                want = channel.serial if channel.connected else None
+                current = registered.get(channel)
+                if (current and current[0]) is want:
+                    continue
+                if current:
+                    sel.unregister(current[1])
+                    del registered[channel]
+                channel.rx.clear()
+                if want is not None:
+                    try:
+                        fd = want.fileno()
+                        sel.register(fd, selectors.EVENT_READ, channel)
+                        registered[channel] = (want, fd)
+                    except Exception as exc:
+                        logger.warning(f"[Serial] Cannot watch {channel.name} port: {exc}")
+
+            if not registered:
+                time.sleep(0.1)
+                continue
+            # The timeout only bounds how long connection changes go unnoticed
+            for key, _ in sel.select(timeout=SERIAL_TIMEOUT):
+                channel = key.data
+                ser = registered[channel][0]
                 try:
-                    if self.motor_serial.in_waiting > 0:
-                        raw = self.motor_serial.readline().decode("utf-8", errors="ignore").strip()
-                        if raw:
-                            self._motor_responses.put(raw)
+                    data = ser.read(ser.in_waiting or 1)
                 except Exception as exc:
-                    logger.warning(f"[Motor] Listener error: {exc}")
-                    self.motor_connected = False
-            time.sleep(0.01)
+                    logger.warning(f"[{channel.label}] Listener error: {exc}")
+                    self._link_lost(channel)
+                    continue
+                channel.rx += data
+                channel.parse(channel.rx)
 
-    def _listen_servo(self) -> None:
+    def _drain_motor_buffer(self, buf: bytearray) -> None:
         while True:
-            if self.servo_connected and self.servo_serial:
-                try:
-                    if self.servo_serial.in_waiting > 0:
-                        raw = self.servo_serial.readline().decode("utf-8", errors="ignore").strip()
-                        if raw:
-                            self._servo_responses.put(raw)
-                except Exception as exc:
-                    logger.warning(f"[Servo] Listener error: {exc}")
-                    self.servo_connected = False
-            time.sleep(0.01)
+            nl = buf.find(b"\n")
+            if nl < 0:
+                if len(buf) > _RX_LIMIT:
+                    buf.clear()
+                return
+            raw = buf[:nl].decode("utf-8", errors="ignore").strip()
+            del buf[:nl + 1]
+            if raw.startswith("T:"):
+                # Streamed telemetry goes straight to the caches
+                self._apply_motor_telemetry(raw)
+            elif raw:
+                self.motor.recent.append(raw)
+                self.motor.mail.post(raw)
+
+    def _apply_motor_telemetry(self, raw: str) -> None:
+        """Parse ``T:<front>,<left>,<right>,<speed>,<dir>`` into the caches."""
+        parts = raw[2:].split(",")
+        if len(parts) != 5:
+            return
+        try:
+            front, left, right, speed = int(parts[0]), int(parts[1]), int(parts[2]), int(parts[3])
+        except ValueError:
+            return
+        now = time.monotonic()
+        self._motor_status = (now, {
+            "connected": True,
+            "speed": speed,
+            "direction": parts[4],
+            "distance_front": front,
+        })
+        with self._distance_cond:
+            self._distances = Distances(front, left, right)
+            self._distances_at = now
+            self._distance_cond.notify_all()
+
+    def _drain_servo_buffer(self, buf: bytearray) -> None:
+        # The servo stream mixes text lines with binary IMU frames
+        while buf:
+            if buf[0] == 0xAA:
+                if len(buf) < 2 or (buf[1] == 0x55 and len(buf) < _IMU_FRAME_LEN):
+                    return   # wait for the rest of the frame
+                end = _IMU_FRAME_LEN - 1
+                if buf[1] == 0x55 and sum(buf[2:end]) & 0xFF == buf[end]:
+                    pitch, roll, ax, ay, az = _IMU_PAYLOAD.unpack_from(buf, 2)
+                    del buf[:_IMU_FRAME_LEN]
+                    self.latest_imu = {"pitch": pitch, "roll": roll, "yaw": 0.0,
+                                       "ax": ax, "ay": ay, "az": az}
+                    self.imu_event.set()
+                else:
+                    del buf[0]   # not a frame — resync on the next byte
+                continue
+            nl = buf.find(b"\n")
+            # A frame sync before the line ends means the bytes ahead of it
+            # are the tail of a corrupt frame, not text
+            sync = buf.find(_IMU_SYNC, 0, nl if nl >= 0 else len(buf))
+            if sync > 0:
+                del buf[:sync]
+                continue
+            if nl < 0:
+                if len(buf) > _RX_LIMIT:
+                    buf.clear()
+                return
+            raw = buf[:nl].decode("utf-8", errors="ignore").strip()
+            del buf[:nl + 1]
+            if raw.startswith("IMU:"):
+                # Text IMU lines from older firmware
+                imu = _parse_imu(raw)
+                if imu is not None:
+                    self.latest_imu = imu
+                    self.imu_event.set()
+            elif raw:
+                self.servo.recent.append(raw)
+                self.servo.mail.post(raw)
 
     # ── Command Senders ────────────────────────────────────────────────────
 
     def send_motor_command(self, command: str) -> bool:
+        """
+        Queue a command for the motor Arduino; returns immediately. A command
+        identical to the previous one within MOTOR_REPEAT_INTERVAL is dropped;
+        queries and STOP are always sent.
+        """
         if not self.motor_connected:
             return False
-        try:
-            with self._motor_lock:
-                # On STOP, clear any queued data so braking is immediate
-                if command == "STOP" and self.motor_serial:
-                    try:
-                        self.motor_serial.reset_input_buffer()
-                        self.motor_serial.reset_output_buffer()
-                    except Exception:
-                        # Older pyserial versions may not support these; ignore
-                        pass
-                self.motor_serial.write(f"{command}\n".encode())
-                self.motor_serial.flush()
-            return True
-        except Exception as exc:
-            logger.error(f"[Motor] Send error: {exc}")
-            self.motor_connected = False
+        key = _coalesce_key(command)
+        if key is not None:
+            now = time.monotonic()
+            last = self._last_motor.get(key)
+            if (command != "STOP" and last is not None and last[0] == command
+                    and now - last[1] < MOTOR_REPEAT_INTERVAL):
+                return True
+            self._last_motor[key] = (command, now)
+        self._tx.put((self.motor, (command,)))
+        return True
+
+    def send_motor_command_sync(self, command: str) -> bool:
+        """
+        Write a command now, bypassing the writer queue and dedup, and block
+        until it has left the UART. Only for shutdown and handshakes.
+        """
+        if not self.motor_connected:
             return False
+        self._write_batch(self.motor, [command], drain=True)
+        return self.motor_connected
+
+    def send_command_sequence(self, steps: list[tuple[str, int]]) -> bool:
+        """
+        Run timed motion steps on the motor Arduino's own clock, e.g.
+        ``[("BACKWARD", 400), ("LEFT", 900), ("STOP", 0)]`` — one serial
+        write for the whole manoeuvre. Any later motion command cancels it.
+        """
+        return self.send_motor_command(
+            "SEQ:" + ";".join(f"{cmd},{ms}" for cmd, ms in steps)
+        )
 
     def send_servo_command(self, command: str) -> bool:
+        """
+        Queue a command for the servo Arduino; returns immediately. Setting a
+        servo to the angle it was last sent is a no-op.
+        """
+        return self.send_servo_command_batch([command])
+
+    def send_servo_command_batch(self, commands: list[str]) -> bool:
+        """
+        Queue several servo commands (e.g. pan and tilt) to go out in the
+        same serial write. Per-servo dedup applies to each one.
+        """
         if not self.servo_connected:
             return False
+        batch = tuple(cmd for cmd in commands if not self._servo_repeat(cmd))
+        if batch:
+            self._tx.put((self.servo, batch))
+        return True
+
+    def _servo_repeat(self, command: str) -> bool:
+        """
+        Track the angle ``command`` sets; True if it only re-sends the angle
+        that servo already has.
+        """
+        head, sep, value = command.partition(":")
+        if sep and head in ("S1", "S2", "S3", "S4"):
+            try:
+                angle = int(value)
+            except ValueError:
+                angle = None
+            if angle is not None:
+                last = self._last_servo_angles.get(head)
+                if last is not None and abs(angle - last) < 1:
+                    return True
+                self._last_servo_angles[head] = angle
+        elif command != "?" and command != "IMU":
+            # CENTER / PRESET / SCAN move servos to positions we don't track
+            self._last_servo_angles.clear()
+        return False
+
+    # ── Writer Thread ──────────────────────────────────────────────────────
+
+    def _writer(self) -> None:
+        """
+        Sole owner of serial writes. Drains everything queued, drops commands
+        superseded by a later one with the same coalescing key, and sends each
+        port's batch as a single newline-delimited write. Never sleeps: a
+        command queued while a batch is being written coalesces into the
+        next batch, and one arriving on an idle queue goes out at once.
+        """
+        while True:
+            pending = [self._tx.get()]
+            while True:
+                try:
+                    pending.append(self._tx.get_nowait())
+                except queue.Empty:
+                    break
+            for channel in self._channels:
+                commands = self._coalesce(
+                    [cmd for ch, batch in pending if ch is channel for cmd in batch]
+                )
+                if commands:
+                    self._write_batch(channel, commands)
+
+    @staticmethod
+    def _coalesce(commands: list[str]) -> list[str]:
+        """Keep only the last command per coalescing key, preserving order."""
+        seen: set[str] = set()
+        kept = []
+        for command in reversed(commands):
+            key = _coalesce_key(command)
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            kept.append(command)
+        kept.reverse()
+        return kept
+
+    def _write_batch(self, channel: _SerialChannel, commands: list[str],
+                     drain: bool = False) -> None:
+        ser = channel.serial
+        if not channel.connected or ser is None:
+            return
         try:
-            with self._servo_lock:
-                self.servo_serial.write(f"{command}\n".encode())
-                self.servo_serial.flush()
-            return True
+            with channel.lock:
+                # On STOP, clear any queued data so braking is immediate. The
+                # firmware also discards input queued behind a STOP, so send
+                # it last (it is the batch's only motion command anyway).
+                if channel is self.motor and "STOP" in commands:
+                    commands = [cmd for cmd in commands if cmd != "STOP"] + ["STOP"]
+                    try:
+                        ser.reset_input_buffer()
+                        ser.reset_output_buffer()
+                    except Exception:
+                        # Older pyserial versions may not support these; ignore
+                        pass
+                # write() hands the bytes to the kernel; only callers that must
+                # know they were transmitted wait for tcdrain() via flush()
+                ser.write(b"".join(
+                    _ENCODED.get(cmd) or f"{cmd}\n".encode() for cmd in commands
+                ))
+                if drain:
+                    ser.flush()
         except Exception as exc:
-            logger.error(f"[Servo] Send error: {exc}")
-            self.servo_connected = False
-            return False
+            logger.error(f"[{channel.label}] Send error: {exc}")
+            self._link_lost(channel)
 
     # ── Sensor Queries ─────────────────────────────────────────────────────
 
-    def _query_motor(self, command: str, prefix: str, timeout: float = 1.0) -> str | None:
-        """Send a command and wait for a prefixed response."""
-        if not self.motor_connected:
+    def _query(self, channel: _SerialChannel, command: str, prefix: str,
+               timeout: float = 1.0) -> str | None:
+        """Send a command and wait for the reply line starting with ``prefix:``."""
+        if not channel.connected:
             return None
-        # Drain stale responses
-        while not self._motor_responses.empty():
-            self._motor_responses.get_nowait()
-        self.send_motor_command(command)
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            if not self._motor_responses.empty():
-                resp = self._motor_responses.get()
-                if resp.startswith(prefix):
-                    return resp
-            time.sleep(0.01)
-        return None
+        event = channel.mail.arm(prefix)
+        # Queries carry no coalescing key, so they skip the send_* dedup
+        self._tx.put((channel, (command,)))
+        return channel.mail.take(prefix, event, timeout)
 
-    def _query_servo(self, command: str, prefix: str, timeout: float = 1.0) -> str | None:
-        if not self.servo_connected:
-            return None
-        while not self._servo_responses.empty():
-            self._servo_responses.get_nowait()
-        self.send_servo_command(command)
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            if not self._servo_responses.empty():
-                resp = self._servo_responses.get()
-                if resp.startswith(prefix):
-                    return resp
-            time.sleep(0.01)
-        return None
+    def _poll_distances(self) -> None:
+        """
+        Fallback for firmware that doesn't stream T: frames: query DA whenever
+        no reading has arrived for 1/SENSOR_POLL_HZ.
+        """
+        interval = 1.0 / SENSOR_POLL_HZ
+        while True:
+            with self._distance_cond:
+                fresh = self._distance_cond.wait(interval)
+            if fresh or not self.motor_connected:
+                continue
+            resp = self._query(self.motor, "DA", "DIST_ALL")
+            if resp:
+                try:
+                    parts = resp.split(":")[1].split(",")
+                    distances = Distances(int(parts[0]), int(parts[1]), int(parts[2]))
+                    with self._distance_cond:
+                        self._distances = distances
+                        self._distances_at = time.monotonic()
+                        self._distance_cond.notify_all()
+                except Exception:
+                    pass
 
     def get_distance_front(self) -> int:
-        resp = self._query_motor("DF", "DIST_F:")
-        return int(resp.split(":")[1]) if resp else 0
+        return self._distances.front
 
     def get_distance_left(self) -> int:
-        resp = self._query_motor("DL", "DIST_L:")
-        return int(resp.split(":")[1]) if resp else 0
+        return self._distances.left
 
     def get_distance_right(self) -> int:
-        resp = self._query_motor("DR", "DIST_R:")
-        return int(resp.split(":")[1]) if resp else 0
+        return self._distances.right
 
-    def get_all_distances(self) -> dict:
-        resp = self._query_motor("DA", "DIST_ALL:")
-        if resp:
-            try:
-                parts = resp.split(":")[1].split(",")
-                return {"front": int(parts[0]), "left": int(parts[1]), "right": int(parts[2])}
-            except Exception:
-                pass
-        return {"front": 0, "left": 0, "right": 0}
+    def get_all_distances(self) -> Distances:
+        """Latest cached readings as an immutable (front, left, right) tuple."""
+        return self._distances
+
+    def wait_for_distances(self, timeout: float) -> tuple[Distances, bool]:
+        """
+        Block until a new reading is published or ``timeout`` expires, then
+        return ``(distances, fresh)``. ``fresh`` is False when the latest
+        reading is older than SENSOR_STALE_AFTER — the stream has stalled
+        and the readings must not be trusted for driving.
+        """
+        with self._distance_cond:
+            self._distance_cond.wait(timeout)
+            fresh = time.monotonic() - self._distances_at <= SENSOR_STALE_AFTER
+            return self._distances, fresh
 
     def get_imu_data(self) -> dict:
-        resp = self._query_servo("IMU", "IMU:")
-        if resp:
-            try:
-                parts = resp.split(":")[1].split(",")
-                return {
-                    "pitch": float(parts[0]),
-                    "roll":  float(parts[1]),
-                    "yaw":   float(parts[2]),
-                    "ax": float(parts[3]),
-                    "ay": float(parts[4]),
-                    "az": float(parts[5]),
-                }
-            except Exception:
-                pass
-        return {"pitch": 0.0, "roll": 0.0, "yaw": 0.0, "ax": 0.0, "ay": 0.0, "az": 0.0}
+        """Latest IMU sample pushed by the servo Arduino (read-only)."""
+        return self.latest_imu
 
     def get_motor_status(self) -> dict:
-        resp = self._query_motor("?", "STATUS:")
+        cached = self._motor_status
+        if cached is not None and self.motor_connected \
+                and time.monotonic() - cached[0] <= _STATUS_MAX_AGE:
+            return cached[1]   # streamed and recent; otherwise ask the firmware
+        resp = self._query(self.motor, "?", "STATUS")
         if resp:
             try:
                 parts = resp.split(":")[1].split(",")
@@ -287,7 +672,7 @@ class ArduinoController:
         return {"connected": self.motor_connected, "speed": 0, "direction": "UNKNOWN", "distance_front": 0}
 
     def get_servo_status(self) -> dict:
-        resp = self._query_servo("?", "STATUS:")
+        resp = self._query(self.servo, "?", "STATUS")
         if resp:
             try:
                 positions = [int(x) for x in resp.split(":")[1].split(",")]
@@ -296,6 +681,16 @@ class ArduinoController:
                 pass
         return {"connected": self.servo_connected, "positions": [90, 90, 90, 90]}
 
+    def get_recent_lines(self, n: int = _LOG_RING_LEN) -> dict:
+        """
+        Last ``n`` reply lines from each Arduino, oldest first. Streamed
+        telemetry (T: / IMU frames) is not kept — it would flood the ring.
+        """
+        return {
+            channel.name: list(channel.recent)[-n:] if n > 0 else []
+            for channel in self._channels
+        }
+
     # ── LED Control (sent to Motor Arduino) ───────────────────────────────
 
     def set_led_mode(self, mode: str) -> bool:
@@ -310,14 +705,11 @@ class ArduinoController:
     # ── Cleanup ────────────────────────────────────────────────────────────
 
     def close(self) -> None:
-        self.motor_connected = False
-        self.servo_connected = False
-        for ser in (self.motor_serial, self.servo_serial):
-            if ser:
-                try:
-                    ser.close()
-                except Exception:
-                    pass
+        # Queued commands die with the writer thread; make sure the last
+        # thing the motors see is a STOP
+        self.send_motor_command_sync("STOP")
+        for channel in self._channels:
+            channel.close()
         logger.info("[Serial] All connections closed.")
 
     def __del__(self):
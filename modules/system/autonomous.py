@@ -18,11 +18,14 @@ from config import (
     OBSTACLE_STOP_DISTANCE, OBSTACLE_WARN_DISTANCE,
     AUTO_EXPLORE_TURN_MIN, AUTO_EXPLORE_TURN_MAX,
     AUTO_PATROL_FORWARD_SEC, AUTO_PATROL_TURN_SEC,
-    SENSOR_SCAN_INTERVAL
+    SENSOR_SCAN_INTERVAL, AUTONOMOUS_CPU
 )
+from modules.common.affinity import pin_current_thread
 
 logger = logging.getLogger(__name__)
 
+_EXPLORE_TURN_SPAN = AUTO_EXPLORE_TURN_MAX - AUTO_EXPLORE_TURN_MIN
+
 
 class AutonomousNavigator:
     """
@@ -39,6 +42,8 @@ class AutonomousNavigator:
         self._running = False
         self._mode = "EXPLORE"
         self._thread: threading.Thread | None = None
+        # Set by stop(); every wait in the drive loops returns early on it
+        self._stop_event = threading.Event()
 
         # Expose last sensor readings for the UI radar
         self.dist_front: int = 0
@@ -60,6 +65,7 @@ class AutonomousNavigator:
                 return True
             self._mode = mode
             self._running = True
+            self._stop_event.clear()
         self._thread = threading.Thread(
             target=self._run, daemon=True, name=f"Auto-{mode}"
         )
@@ -70,6 +76,12 @@ class AutonomousNavigator:
     def stop(self) -> None:
         with self._lock:
             self._running = False
+            self._stop_event.set()
+        # Let the drive thread unwind first so it can't queue another
+        # command after our STOP.
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
         self._arduino.send_motor_command("STOP")
         self.current_action = "IDLE"
         logger.info("[Auto] Stopped.")
@@ -80,6 +92,7 @@ class AutonomousNavigator:
     # ── Main Loop ────────────────────────────────────────────────────────────
 
     def _run(self) -> None:
+        pin_current_thread(AUTONOMOUS_CPU, "Autonomous")
         if self._mode == "PATROL":
             self._patrol_loop()
         else:
@@ -87,59 +100,72 @@ class AutonomousNavigator:
 
     def _explore_loop(self) -> None:
         """Random-walk with 3-sensor obstacle avoidance."""
+        # Loop-invariant lookups hoisted into locals
+        arduino = self._arduino
+        send = arduino.send_motor_command
+        stop_cm, warn_cm = OBSTACLE_STOP_DISTANCE, OBSTACLE_WARN_DISTANCE
+        scan_interval = SENSOR_SCAN_INTERVAL
         while self._running:
             if self._check_safety_halt():
-                time.sleep(0.2)
+                self._stop_event.wait(0.2)
                 continue
 
-            distances = self._arduino.get_all_distances()
-            self.dist_front = distances.get("front", 0)
-            self.dist_left  = distances.get("left", 0)
-            self.dist_right = distances.get("right", 0)
+            # Wakes as soon as a new reading lands; scan_interval caps the wait
+            (front, left, right), fresh = arduino.wait_for_distances(scan_interval)
+            if not fresh:
+                self._halt_stale_sensors()
+                continue
+            self.dist_front, self.dist_left, self.dist_right = front, left, right
 
-            if self.dist_front > 0 and self.dist_front < OBSTACLE_STOP_DISTANCE:
+            # 0 means no echo, so only positive readings count as obstacles
+            if 0 < front < stop_cm:
                 self._handle_front_obstacle()
-            elif self.dist_left > 0 and self.dist_left < OBSTACLE_STOP_DISTANCE:
+            elif 0 < left < stop_cm:
                 self._turn_right(0.4)
-            elif self.dist_right > 0 and self.dist_right < OBSTACLE_STOP_DISTANCE:
+            elif 0 < right < stop_cm:
                 self._turn_left(0.4)
-            elif self.dist_front > 0 and self.dist_front < OBSTACLE_WARN_DISTANCE:
+            elif 0 < front < warn_cm:
                 # Slow down when approaching
-                self._arduino.send_motor_command("SLOW")
+                send("SLOW")
                 self.current_action = "SLOW"
             else:
-                self._arduino.send_motor_command("FORWARD")
+                send("FORWARD")
                 self.current_action = "FORWARD"
 
-            time.sleep(SENSOR_SCAN_INTERVAL)
-
     def _patrol_loop(self) -> None:
         """Structured rectangular patrol: forward → right → forward → right…"""
+        arduino = self._arduino
+        send = arduino.send_motor_command
+        stop_cm, scan_interval = OBSTACLE_STOP_DISTANCE, SENSOR_SCAN_INTERVAL
         legs = 0
         while self._running:
             if self._check_safety_halt():
-                time.sleep(0.2)
+                self._stop_event.wait(0.2)
                 continue
 
             # Drive forward for one patrol leg, checking sensors
-            deadline = time.time() + AUTO_PATROL_FORWARD_SEC
-            while self._running and time.time() < deadline:
+            deadline = time.monotonic() + AUTO_PATROL_FORWARD_SEC
+            stale = False
+            while self._running and time.monotonic() < deadline:
                 if self._check_safety_halt():
                     break
-                distances = self._arduino.get_all_distances()
-                self.dist_front = distances.get("front", 0)
-                self.dist_left  = distances.get("left", 0)
-                self.dist_right = distances.get("right", 0)
+                distances, fresh = arduino.wait_for_distances(scan_interval)
+                if not fresh:
+                    # Abandon the leg; it restarts once readings resume
+                    self._halt_stale_sensors()
+                    stale = True
+                    break
+                self.dist_front, self.dist_left, self.dist_right = distances
+                front = distances.front
 
-                if self.dist_front > 0 and self.dist_front < OBSTACLE_STOP_DISTANCE:
+                if 0 < front < stop_cm:
                     self._handle_front_obstacle()
                     break
-                self._arduino.send_motor_command("FORWARD")
+                send("FORWARD")
                 self.current_action = "FORWARD"
-                time.sleep(SENSOR_SCAN_INTERVAL)
 
             # Turn right at each corner
-            if self._running:
+            if self._running and not stale:
                 self._turn_right(AUTO_PATROL_TURN_SEC)
                 legs += 1
 
@@ -157,37 +183,44 @@ class AutonomousNavigator:
         if self._imu.collision_detected:
             self._arduino.send_motor_command("STOP")
             self.current_action = "HALT_COLLISION"
-            time.sleep(0.5)
+            self._stop_event.wait(0.5)
             return True
         return False
 
+    def _halt_stale_sensors(self) -> None:
+        """Stop while distance readings are stale — never drive on old data."""
+        if self.current_action != "HALT_SENSORS":
+            self._arduino.send_motor_command("STOP")
+            self.current_action = "HALT_SENSORS"
+            logger.warning("[Auto] Safety halt — distance readings are stale.")
+
     # ── Manoeuvres ───────────────────────────────────────────────────────────
 
     def _handle_front_obstacle(self) -> None:
-        self._arduino.send_motor_command("STOP")
-        self.current_action = "STOP"
-        time.sleep(0.3)
-        self._arduino.send_motor_command("BACKWARD")
-        self.current_action = "BACKWARD"
-        time.sleep(0.4)
-        self._arduino.send_motor_command("STOP")
-
         # Choose turn direction based on side sensor data
-        if self.dist_left > self.dist_right:
-            self._turn_left(random.uniform(AUTO_EXPLORE_TURN_MIN, AUTO_EXPLORE_TURN_MAX))
-        else:
-            self._turn_right(random.uniform(AUTO_EXPLORE_TURN_MIN, AUTO_EXPLORE_TURN_MAX))
+        duration = AUTO_EXPLORE_TURN_MIN + random.random() * _EXPLORE_TURN_SPAN
+        turn = "LEFT" if self.dist_left > self.dist_right else "RIGHT"
+        # Stop, back off and turn away on the Arduino's own timers — a single
+        # serial write instead of one per step.
+        self._arduino.send_command_sequence([
+            ("STOP", 300),
+            ("BACKWARD", 400),
+            (turn, int(duration * 1000)),
+            ("STOP", 0),
+        ])
+        self.current_action = f"AVOID_{turn}"
+        self._stop_event.wait(0.7 + duration)
 
     def _turn_left(self, duration: float) -> None:
         self._arduino.send_motor_command("LEFT")
         self.current_action = "TURN_LEFT"
-        time.sleep(duration)
+        self._stop_event.wait(duration)
         self._arduino.send_motor_command("STOP")
 
     def _turn_right(self, duration: float) -> None:
         self._arduino.send_motor_command("RIGHT")
         self.current_action = "TURN_RIGHT"
-        time.sleep(duration)
+        self._stop_event.wait(duration)
         self._arduino.send_motor_command("STOP")
 
     # ── Status ──────────────────────────────────────────────────────────────
@@ -4,119 +4,379 @@ SYSTEM MODULE — ML OBJECT DETECTION (YOLOv8 / NCNN)
 ============================================================================
 Wraps Ultralytics YOLOv8 inference with:
   • NCNN export preference for maximum Raspberry Pi performance
-  • Frame-rate limiting to protect CPU headroom
-  • Thread-safe detection result sharing
-  • Annotated frame overlay injection into the camera pipeline
-Falls back gracefully when ultralytics is not installed.
+  • An ONNX Runtime path (no ultralytics in the hot loop) for .onnx exports
+  • A dedicated inference thread, rate-limited to protect CPU headroom
+  • Lock-free detection result sharing (immutable snapshot swap)
+  • Cheap cached-box overlay injection into the camera pipeline
+Falls back gracefully when neither ultralytics nor onnxruntime is installed.
 ============================================================================
 """
 
+import os
+import ast
+import math
 import threading
 import time
 import logging
-from config import ML_MODEL_NAME, ML_CONFIDENCE_THRESHOLD, ML_DETECTION_FPS
+from config import (
+    ML_MODEL_NAME, ML_CONFIDENCE_THRESHOLD, ML_DETECTION_FPS, ML_NMS_IOU,
+    ML_IMGSZ, ML_PRECISION, ML_TORCH_COMPILE, CAMERA_RESOLUTION
+)
 
 logger = logging.getLogger(__name__)
 
 try:
-    from ultralytics import YOLO
     import numpy as np
     import cv2
-    ULTRALYTICS_AVAILABLE = True
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+try:
+    from ultralytics import YOLO
+    ULTRALYTICS_AVAILABLE = CV2_AVAILABLE
 except ImportError:
     ULTRALYTICS_AVAILABLE = False
-    logger.warning("[ML] ultralytics not installed — ML detection disabled.")
+
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = CV2_AVAILABLE
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+if not (ULTRALYTICS_AVAILABLE or ONNXRUNTIME_AVAILABLE):
+    logger.warning("[ML] ultralytics / onnxruntime not installed — ML detection disabled.")
+
+# Class-offset for batched NMS: shifting each class's boxes this far apart
+# keeps NMSBoxes from suppressing across classes
+_NMS_CLASS_OFFSET = 4096.0
+
+# One row per detection, stored contiguously; labels are looked up from the
+# class id only when the table is serialised or drawn
+if CV2_AVAILABLE:
+    _DET_DTYPE = np.dtype([("class_id", "<i2"), ("conf", "<f4"), ("bbox", "<i2", (4,))])
+    _NO_DETECTIONS = np.empty(0, _DET_DTYPE)
+else:
+    _NO_DETECTIONS = ()
 
 
 class MLDetector:
     """
     Runs YOLOv8 inference on camera frames and exposes detection results
-    to the rest of the application. Designed to be injected into the
-    CameraManager as an overlay function.
+    to the rest of the application. Inference runs on its own thread at
+    ML_DETECTION_FPS; only the box-drawing overlay is injected into the
+    CameraManager, so model latency never throttles the video stream.
     """
 
-    def __init__(self):
-        self._lock = threading.Lock()
+    def __init__(self, warmup: bool = True, precision: str = ML_PRECISION):
         self._model = None
+        self._session = None      # onnxruntime.InferenceSession when using ONNX
+        self._eager_module = None # pre-torch.compile module, kept for fallback
+        self._precision = precision
+        self._half = False        # ultralytics predict(half=True) — CUDA only
+        self._pad = None          # reusable ML_IMGSZ² letterbox input (ultralytics path)
+        self._pad_key = None      # (frame h, frame w) the pad was laid out for
+        self._overlay_buf = None  # reused annotated-frame buffer for draw_overlay
         self._available = False
         self._enabled = False
-        self._detections: list = []
+        self._detections = _NO_DETECTIONS   # _DET_DTYPE structured array
+        self._names: dict = {}              # class id → label
         self._frame_interval = 1.0 / ML_DETECTION_FPS
-        self._last_run = 0.0
+        self._frame_source = None
+        self._enabled_event = threading.Event()
+        self.version = 0   # bumped whenever get_status() would change
 
-        if ULTRALYTICS_AVAILABLE:
+        if ULTRALYTICS_AVAILABLE or ONNXRUNTIME_AVAILABLE:
             self._load_model()
+        if self._available and warmup:
+            self._warm_up()
+        if self._available:
+            threading.Thread(
+                target=self._inference_loop, daemon=True, name="MLInference"
+            ).start()
 
     # ── Model Loading ────────────────────────────────────────────────────────
 
     def _load_model(self) -> None:
         try:
-            # Prefer NCNN export for Raspberry Pi performance
+            # Prefer NCNN export for Raspberry Pi performance, then ONNX
             ncnn_path = ML_MODEL_NAME.replace(".pt", "_ncnn_model")
-            import os
-            if os.path.isdir(ncnn_path):
+            onnx_path = ML_MODEL_NAME if ML_MODEL_NAME.endswith(".onnx") \
+                else ML_MODEL_NAME.replace(".pt", ".onnx")
+            if ULTRALYTICS_AVAILABLE and os.path.isdir(ncnn_path):
                 self._model = YOLO(ncnn_path, task="detect")
+                self._names = self._model.names
                 logger.info(f"[ML] Loaded NCNN model from {ncnn_path}")
-            else:
+            elif ONNXRUNTIME_AVAILABLE and os.path.isfile(onnx_path):
+                self._load_onnx(onnx_path)
+            elif ULTRALYTICS_AVAILABLE:
                 self._model = YOLO(ML_MODEL_NAME)
+                self._names = self._model.names
                 logger.info(f"[ML] Loaded PyTorch model {ML_MODEL_NAME}")
                 logger.info("[ML] Tip: export to NCNN for ~3× faster inference on Pi.")
+                self._configure_torch_precision()
+                if ML_TORCH_COMPILE:
+                    self._compile_torch_model()
+            else:
+                logger.error(f"[ML] No usable model: {onnx_path} not found and ultralytics missing")
+                return
             self._available = True
         except Exception as exc:
             logger.error(f"[ML] Model load failed: {exc}")
             self._available = False
 
-    # ── Overlay Function (injected into CameraManager) ───────────────────────
+    def _configure_torch_precision(self) -> None:
+        """
+        Apply the requested precision to the PyTorch model. FP16 needs a CUDA
+        device; int8 has to be baked in at export time (NCNN / ONNX), so a
+        .pt model can only be pointed at the right export.
+        """
+        try:
+            import torch
+            torch.set_float32_matmul_precision("high")
+            if self._precision == "fp16":
+                self._half = torch.cuda.is_available()
+                if not self._half:
+                    logger.info("[ML] FP16 needs CUDA — running FP32 on CPU.")
+            elif self._precision == "int8":
+                logger.info("[ML] int8 needs a quantised export: "
+                            "yolo export format=ncnn int8=True — running FP32.")
+        except Exception as exc:
+            logger.warning(f"[ML] Precision setup failed: {exc}")
+
+    def _compile_torch_model(self) -> None:
+        """Wrap the PyTorch module in torch.compile; checked by _warm_up()."""
+        try:
+            import torch
+            if int(torch.__version__.split(".")[0]) < 2:
+                logger.info("[ML] torch.compile needs torch ≥ 2 — skipped.")
+                return
+            self._eager_module = self._model.model
+            self._model.model = torch.compile(self._eager_module, mode="reduce-overhead")
+            logger.info("[ML] PyTorch model wrapped with torch.compile.")
+        except Exception as exc:
+            logger.warning(f"[ML] torch.compile unavailable: {exc}")
 
-    def process_frame(self, frame_array):
+    def _warm_up(self) -> None:
         """
-        Called by CameraManager for each captured frame.
-        Returns the frame (annotated if ML is enabled and ready).
+        Run one throwaway inference at load time so lazy initialisation (and
+        torch.compile's graph capture) isn't paid on the first real frame.
         """
-        if not self._enabled or not self._available:
-            return frame_array
+        width, height = CAMERA_RESOLUTION
+        started = time.time()
+        ok = self._infer(np.zeros((height, width, 3), np.uint8)) is not None
+        if not ok and self._eager_module is not None:
+            logger.warning("[ML] Compiled model failed warm-up — using eager PyTorch.")
+            self._model.model = self._eager_module
+            self._eager_module = None
+            ok = self._infer(np.zeros((height, width, 3), np.uint8)) is not None
+        if ok:
+            logger.info(f"[ML] Warm-up inference took {time.time() - started:.1f}s")
 
-        now = time.time()
-        if now - self._last_run < self._frame_interval:
-            # Return last annotated frame without re-running inference
-            return frame_array
+    def _load_onnx(self, path: str) -> None:
+        """
+        Load an ultralytics ONNX export (``yolo export format=onnx``). Input
+        and output shapes are static, so the resize and input tensors are
+        allocated once here and reused for every frame.
+        """
+        preferred = ("CUDAExecutionProvider", "CPUExecutionProvider")
+        providers = [p for p in preferred if p in ort.get_available_providers()]
+        self._session = ort.InferenceSession(path, providers=providers)
+        inp = self._session.get_inputs()[0]
+        self._in_name = inp.name
+        _, _, in_h, in_w = inp.shape
+        dtype = np.float16 if inp.type == "tensor(float16)" else np.float32
+        self._resized = np.empty((in_h, in_w, 3), np.uint8)
+        self._blob = np.empty((1, 3, in_h, in_w), dtype)
+        # ultralytics stores the class map as a dict literal in the metadata
+        meta = self._session.get_modelmeta().custom_metadata_map
+        self._names = ast.literal_eval(meta.get("names", "{}"))
+        logger.info(f"[ML] Loaded ONNX model {path} ({providers[0]})")
+
+    # ── Inference Thread ─────────────────────────────────────────────────────
+
+    def set_frame_source(self, fn) -> None:
+        """Set the callable returning the newest raw frame (or None)."""
+        self._frame_source = fn
 
-        self._last_run = now
+    def set_target_fps(self, fps: float) -> None:
+        """
+        Change the detection rate cap (clamped to 0.5–30 FPS). Raises
+        ValueError for NaN or infinity, which would slip past the clamp.
+        """
+        fps = float(fps)
+        if not math.isfinite(fps):
+            raise ValueError(f"fps must be finite, got {fps}")
+        fps = min(max(fps, 0.5), 30.0)
+        self._frame_interval = 1.0 / fps
+        self.version += 1
+        logger.info(f"[ML] Detection rate cap set to {fps:g} FPS.")
+
+    def _inference_loop(self) -> None:
+        """
+        Run the model on the newest raw camera frame at the FPS cap,
+        independently of the camera framerate, and cache the detections.
+        """
+        last_frame = None
+        while True:
+            self._enabled_event.wait()
+            started = time.monotonic()
+            frame_array = self._frame_source() if self._frame_source else None
+            # The capture loop publishes a fresh array per frame, so an
+            # identical object means the camera hasn't advanced — skip it
+            if frame_array is not None and frame_array is not last_frame and self._available:
+                last_frame = frame_array
+                detections = self._infer(frame_array)
+                # Only this thread publishes; a whole new table is swapped in
+                # with one attribute store, so readers never need a lock
+                if detections is not None and self._enabled \
+                        and detections.tobytes() != self._detections.tobytes():
+                    self._detections = detections
+                    self.version += 1
+            remaining = self._frame_interval - (time.monotonic() - started)
+            if remaining > 0:
+                time.sleep(remaining)
+
+    def _letterbox(self, frame_array):
+        """
+        Shrink the frame into the reusable ML_IMGSZ × ML_IMGSZ pad buffer,
+        keeping aspect ratio. The grey border is only repainted when the
+        frame shape changes. Returns (pad, scale).
+        """
+        h, w = frame_array.shape[:2]
+        r = ML_IMGSZ / max(h, w)
+        nh, nw = int(h * r), int(w * r)
+        if self._pad_key != (h, w):
+            self._pad = np.full((ML_IMGSZ, ML_IMGSZ, 3), 114, np.uint8)
+            self._pad_key = (h, w)
+        cv2.resize(frame_array, (nw, nh), dst=self._pad[:nh, :nw],
+                   interpolation=cv2.INTER_AREA)
+        return self._pad, r
+
+    @staticmethod
+    def _pack(cls, conf, xyxy):
+        """Build the structured detection table from aligned column arrays."""
+        dets = np.empty(len(cls), _DET_DTYPE)
+        dets["class_id"] = cls
+        dets["conf"] = conf
+        dets["bbox"] = xyxy
+        return dets
+
+    def _infer(self, frame_array):
+        if self._session is not None:
+            return self._infer_onnx(frame_array)
         try:
+            # Fixed-shape input: ultralytics skips its own resize and
+            # torch.compile never sees a new shape
+            padded, r = self._letterbox(frame_array)
             results = self._model.predict(
-                frame_array,
+                padded,
+                imgsz=ML_IMGSZ,
+                half=self._half,
                 conf=ML_CONFIDENCE_THRESHOLD,
                 verbose=False,
                 stream=False,
             )
-            detections = []
-            annotated = frame_array.copy()
-            for result in results:
-                for box in result.boxes:
-                    cls_id  = int(box.cls[0])
-                    conf    = float(box.conf[0])
-                    label   = self._model.names.get(cls_id, str(cls_id))
-                    x1, y1, x2, y2 = [int(v) for v in box.xyxy[0]]
-                    detections.append({
-                        "label": label,
-                        "confidence": round(conf, 2),
-                        "bbox": [x1, y1, x2, y2],
-                    })
-                    # Draw bounding box
-                    cv2.rectangle(annotated, (x1, y1), (x2, y2), (0, 255, 0), 2)
-                    cv2.putText(
-                        annotated, f"{label} {conf:.0%}",
-                        (x1, y1 - 8), cv2.FONT_HERSHEY_SIMPLEX,
-                        0.55, (0, 255, 0), 1
-                    )
-
-            with self._lock:
-                self._detections = detections
-
-            return annotated
+            boxes = results[0].boxes
+            if boxes is None or not len(boxes):
+                return _NO_DETECTIONS
+            # One device→host copy per tensor, not three per box;
+            # boxes are in pad pixels, so undo the letterbox scale
+            return self._pack(
+                boxes.cls.cpu().numpy(),
+                boxes.conf.cpu().numpy(),
+                boxes.xyxy.cpu().numpy() / r,
+            )
         except Exception as exc:
             logger.debug(f"[ML] Inference error: {exc}")
+            return None
+
+    def _infer_onnx(self, frame_array):
+        try:
+            in_h, in_w = self._resized.shape[:2]
+            h, w = frame_array.shape[:2]
+            cv2.resize(frame_array, (in_w, in_h), dst=self._resized)
+            # HWC BGR uint8 → NCHW RGB in [0, 1], written into the reused tensor
+            np.multiply(self._resized.transpose(2, 0, 1)[::-1], 1.0 / 255.0,
+                        out=self._blob[0], casting="unsafe")
+            preds = self._session.run(None, {self._in_name: self._blob})[0][0].T
+            # preds: (anchors, 4 + classes) — cx, cy, w, h then class scores
+            scores = preds[:, 4:]
+            cls = scores.argmax(axis=1)
+            conf = scores[np.arange(len(cls)), cls]
+            keep = conf >= ML_CONFIDENCE_THRESHOLD
+            if not keep.any():
+                return _NO_DETECTIONS
+            boxes, cls, conf = preds[keep, :4].astype(np.float32), cls[keep], conf[keep].astype(np.float32)
+            # Centre/size in model pixels → top-left/size in frame pixels
+            boxes[:, :2] -= boxes[:, 2:] / 2
+            boxes *= np.array([w / in_w, h / in_h, w / in_w, h / in_h], np.float32)
+            shifted = boxes.copy()
+            shifted[:, :2] += cls[:, None] * _NMS_CLASS_OFFSET
+            idx = cv2.dnn.NMSBoxes(shifted.tolist(), conf.tolist(),
+                                   ML_CONFIDENCE_THRESHOLD, ML_NMS_IOU)
+            idx = np.asarray(idx, dtype=np.int64).reshape(-1)
+            boxes, cls, conf = boxes[idx], cls[idx], conf[idx]
+            boxes[:, 2:] += boxes[:, :2]
+            return self._pack(cls, conf, boxes)
+        except Exception as exc:
+            logger.debug(f"[ML] ONNX inference error: {exc}")
+            return None
+
+    # ── Overlay Function (injected into CameraManager) ───────────────────────
+
+    def get_cached_detections(self):
+        """
+        Return the newest detection table (_DET_DTYPE structured array).
+        The table is shared with every other reader — do not modify it.
+        """
+        return self._detections
+
+    def get_detections_as_dicts(self) -> list:
+        """The detection table as JSON-ready dicts (label, confidence, bbox)."""
+        dets = self.get_cached_detections()
+        if not len(dets):
+            return []
+        names = self._names
+        return [
+            {
+                "label": names.get(c, str(c)),
+                "confidence": round(p, 2),
+                "bbox": b,
+            }
+            for c, p, b in zip(dets["class_id"].tolist(), dets["conf"].tolist(),
+                               dets["bbox"].tolist())
+        ]
+
+    def draw_overlay(self, frame_array):
+        """
+        Called by CameraManager for each captured frame. Only draws the
+        cached bounding boxes — inference runs on its own thread — so the
+        stream keeps the full camera framerate. The returned array is
+        reused on the next call; the capture loop is done with it by then.
+        """
+        if not self._enabled:
             return frame_array
+        detections = self.get_cached_detections()
+        if not len(detections):
+            return frame_array
+        # The raw frame is shared with the inference thread; draw on a copy
+        # in a buffer that is allocated once, not per frame.
+        annotated = self._overlay_buf
+        if annotated is None or annotated.shape != frame_array.shape:
+            annotated = self._overlay_buf = np.empty_like(frame_array)
+        np.copyto(annotated, frame_array)
+        names = self._names
+        for c, p, (x1, y1, x2, y2) in zip(detections["class_id"].tolist(),
+                                          detections["conf"].tolist(),
+                                          detections["bbox"].tolist()):
+            cv2.rectangle(annotated, (x1, y1), (x2, y2), (0, 255, 0), 2)
+            cv2.putText(
+                annotated, f"{names.get(c, str(c))} {p:.0%}",
+                (x1, y1 - 8), cv2.FONT_HERSHEY_SIMPLEX,
+                0.55, (0, 255, 0), 1
+            )
+        return annotated
 
     # ── Control ──────────────────────────────────────────────────────────────
 
@@ -124,21 +384,25 @@ class MLDetector:
         if not self._available:
             return False
         self._enabled = True
+        self._enabled_event.set()
+        self.version += 1
         logger.info("[ML] Detection enabled.")
         return True
 
     def disable(self) -> None:
         self._enabled = False
+        self._enabled_event.clear()
+        self._detections = _NO_DETECTIONS
+        self.version += 1
         logger.info("[ML] Detection disabled.")
 
     # ── Status ───────────────────────────────────────────────────────────────
 
     def get_status(self) -> dict:
-        with self._lock:
-            return {
-                "available": self._available,
-                "enabled":   self._enabled,
-                "detections": list(self._detections),
-                "model": ML_MODEL_NAME,
-                "fps_limit": ML_DETECTION_FPS,
-            }
+        return {
+            "available": self._available,
+            "enabled":   self._enabled,
+            "detections": self.get_detections_as_dicts(),
+            "model": ML_MODEL_NAME,
+            "fps_limit": round(1.0 / self._frame_interval, 1),
+        }
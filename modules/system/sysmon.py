@@ -12,10 +12,11 @@ import threading
 import time
 import logging
 import os
-from collections import deque
 from config import (
-    SYSMON_INTERVAL, CPU_WARN_TEMP, CPU_CRITICAL_TEMP, MAX_MEMORY_LOGS
+    SYSMON_INTERVAL, CPU_WARN_TEMP, CPU_CRITICAL_TEMP, MAX_MEMORY_LOGS,
+    UI_HISTORY_LEN
 )
+from modules.common.ring import HistoryRing
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +28,25 @@ except ImportError:
     logger.warning("[SysMon] psutil not installed — install with: pip install psutil")
 
 
-def _read_cpu_temp() -> float:
-    """Read Raspberry Pi CPU temperature from the thermal zone sysfs node."""
+_THERMAL_NODE = "/sys/class/thermal/thermal_zone0/temp"
+_DISK_SAMPLE_EVERY = 30   # samples between disk_usage() calls — it moves slowly
+
+
+def _open_thermal_node() -> int | None:
+    """Open the Pi CPU thermal zone once; sysfs refreshes it on every read."""
+    try:
+        return os.open(_THERMAL_NODE, os.O_RDONLY)
+    except OSError:
+        return None
+
+
+def _read_cpu_temp(fd: int | None) -> float:
+    """Read the CPU temperature (°C) with one pread on the already-open node."""
+    if fd is None:
+        return 0.0
     try:
-        with open("/sys/class/thermal/thermal_zone0/temp") as f:
-            return round(int(f.read().strip()) / 1000.0, 1)
-    except Exception:
+        return int(os.pread(fd, 16, 0)) / 1000.0
+    except (OSError, ValueError):
         return 0.0
 
 
@@ -43,8 +57,6 @@ class SystemMonitor:
     """
 
     def __init__(self):
-        self._lock = threading.Lock()
-
         # Latest snapshot
         self.cpu_percent: float  = 0.0
         self.cpu_temp: float     = 0.0
@@ -56,71 +68,90 @@ class SystemMonitor:
         self.net_recv_kb: float  = 0.0
         self.uptime_sec: float   = 0.0
         self.alert_level: str    = "OK"
+        self.version: int        = 0      # bumped whenever get_status() would change
 
         # Rolling histories
-        self.cpu_history:  deque = deque(maxlen=MAX_MEMORY_LOGS)
-        self.temp_history: deque = deque(maxlen=MAX_MEMORY_LOGS)
-        self.mem_history:  deque = deque(maxlen=MAX_MEMORY_LOGS)
+        self.cpu_history  = HistoryRing(MAX_MEMORY_LOGS)
+        self.temp_history = HistoryRing(MAX_MEMORY_LOGS)
+        self.mem_history  = HistoryRing(MAX_MEMORY_LOGS)
 
         self._prev_net_sent = 0
         self._prev_net_recv = 0
         self._start_time = time.time()
+        self._thermal_fd = _open_thermal_node()
+        self._samples = 0
+        if PSUTIL_AVAILABLE:
+            psutil.cpu_percent(interval=None)   # prime: the first call always returns 0.0
+        # Immutable status dict, rebuilt by the sampler and swapped in whole
+        # so readers never take a lock
+        self._status = self._build_status()
+        self._stop_event = threading.Event()   # set by shutdown(); wakes the sampler
 
         threading.Thread(target=self._sample_loop, daemon=True, name="SysMon").start()
 
     # ── Sampling ─────────────────────────────────────────────────────────────
 
     def _sample_loop(self) -> None:
-        while True:
+        while not self._stop_event.is_set():
             self._sample()
-            time.sleep(SYSMON_INTERVAL)
+            self._stop_event.wait(SYSMON_INTERVAL)
 
     def _sample(self) -> None:
-        with self._lock:
-            if PSUTIL_AVAILABLE:
-                self.cpu_percent  = psutil.cpu_percent(interval=None)
-                mem               = psutil.virtual_memory()
-                self.mem_percent  = mem.percent
-                self.mem_used_mb  = round(mem.used / 1024 / 1024, 1)
-                self.mem_total_mb = round(mem.total / 1024 / 1024, 1)
-                disk              = psutil.disk_usage("/")
-                self.disk_percent = disk.percent
-                net               = psutil.net_io_counters()
-                self.net_sent_kb  = round((net.bytes_sent - self._prev_net_sent) / 1024, 1)
-                self.net_recv_kb  = round((net.bytes_recv - self._prev_net_recv) / 1024, 1)
-                self._prev_net_sent = net.bytes_sent
-                self._prev_net_recv = net.bytes_recv
-
-            self.cpu_temp   = _read_cpu_temp()
-            self.uptime_sec = round(time.time() - self._start_time, 0)
-
-            self.cpu_history.append(round(self.cpu_percent, 1))
-            self.temp_history.append(self.cpu_temp)
-            self.mem_history.append(round(self.mem_percent, 1))
-
-            if self.cpu_temp >= CPU_CRITICAL_TEMP:
-                self.alert_level = "CRITICAL"
-            elif self.cpu_temp >= CPU_WARN_TEMP:
-                self.alert_level = "WARN"
-            else:
-                self.alert_level = "OK"
+        if PSUTIL_AVAILABLE:
+            self.cpu_percent  = psutil.cpu_percent(interval=None)
+            mem               = psutil.virtual_memory()
+            self.mem_percent  = mem.percent
+            self.mem_used_mb  = mem.used / 1048576
+            self.mem_total_mb = mem.total / 1048576
+            if self._samples % _DISK_SAMPLE_EVERY == 0:
+                self.disk_percent = psutil.disk_usage("/").percent
+            net               = psutil.net_io_counters()
+            self.net_sent_kb  = (net.bytes_sent - self._prev_net_sent) / 1024
+            self.net_recv_kb  = (net.bytes_recv - self._prev_net_recv) / 1024
+            self._prev_net_sent = net.bytes_sent
+            self._prev_net_recv = net.bytes_recv
+
+        self._samples  += 1
+        self.cpu_temp   = _read_cpu_temp(self._thermal_fd)
+        self.uptime_sec = time.time() - self._start_time
+
+        # Raw samples; rounding happens once, in _build_status()
+        self.cpu_history.append(self.cpu_percent)
+        self.temp_history.append(self.cpu_temp)
+        self.mem_history.append(self.mem_percent)
+
+        if self.cpu_temp >= CPU_CRITICAL_TEMP:
+            self.alert_level = "CRITICAL"
+        elif self.cpu_temp >= CPU_WARN_TEMP:
+            self.alert_level = "WARN"
+        else:
+            self.alert_level = "OK"
+        self._status = self._build_status()
+        self.version += 1
+
+    def _build_status(self) -> dict:
+        return {
+            "cpu_percent":  round(self.cpu_percent, 1),
+            "cpu_temp":     round(self.cpu_temp, 1),
+            "mem_percent":  round(self.mem_percent, 1),
+            "mem_used_mb":  round(self.mem_used_mb, 1),
+            "mem_total_mb": round(self.mem_total_mb, 1),
+            "disk_percent": round(self.disk_percent, 1),
+            "net_sent_kb":  round(self.net_sent_kb, 1),
+            "net_recv_kb":  round(self.net_recv_kb, 1),
+            "uptime_sec":   round(self.uptime_sec),
+            "alert_level":  self.alert_level,
+            "cpu_history":  [round(v, 1) for v in self.cpu_history.latest(UI_HISTORY_LEN)],
+            "temp_history": [round(v, 1) for v in self.temp_history.latest(UI_HISTORY_LEN)],
+            "mem_history":  [round(v, 1) for v in self.mem_history.latest(UI_HISTORY_LEN)],
+        }
 
     # ── Public API ──────────────────────────────────────────────────────────
 
     def get_status(self) -> dict:
-        with self._lock:
-            return {
-                "cpu_percent":  round(self.cpu_percent, 1),
-                "cpu_temp":     self.cpu_temp,
-                "mem_percent":  round(self.mem_percent, 1),
-                "mem_used_mb":  self.mem_used_mb,
-                "mem_total_mb": self.mem_total_mb,
-                "disk_percent": round(self.disk_percent, 1),
-                "net_sent_kb":  self.net_sent_kb,
-                "net_recv_kb":  self.net_recv_kb,
-                "uptime_sec":   self.uptime_sec,
-                "alert_level":  self.alert_level,
-                "cpu_history":  list(self.cpu_history)[-60:],
-                "temp_history": list(self.temp_history)[-60:],
-                "mem_history":  list(self.mem_history)[-60:],
-            }
+        """Latest sample as a shared, read-only dict."""
+        return self._status
+
+    def shutdown(self) -> None:
+        """Stop sampling now rather than after the current interval."""
+        self._stop_event.set()
@@ -10,15 +10,53 @@ JSON log files to disk for post-mission analysis.
 
 import json
 import os
+import atexit
 import time
+import queue
 import threading
 import logging
 from collections import deque
+from itertools import islice
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from config import LOG_DIR, MAX_MEMORY_LOGS
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_WRITE_QUEUE_LEN = 10_000   # log lines buffered for the writer thread
+_WRITE_BATCH     = 256      # lines joined into one write() call
+_FLUSH_LINES     = 64       # flush after this many unflushed lines…
+_FLUSH_INTERVAL  = 1.0      # …or once the oldest has waited this long (s)
+_EVENT_FIELDS    = ("ts", "level", "source", "message")
+
+
+def _dumps(obj) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+@dataclass(slots=True)
+class Snapshot:
+    """Full telemetry snapshot. One instance is reused and updated in place."""
+    ts:         str  = ""
+    motor:      dict = field(default_factory=dict)
+    servo:      dict = field(default_factory=dict)
+    autonomous: dict = field(default_factory=dict)
+    imu:        dict = field(default_factory=dict)
+    power:      dict = field(default_factory=dict)
+    system:     dict = field(default_factory=dict)
+    camera:     dict = field(default_factory=dict)
+    ml:         dict = field(default_factory=dict)
+    led:        dict = field(default_factory=dict)
+    recording:  bool = False
+
 
 class TelemetryLogger:
     """
@@ -28,11 +66,23 @@ class TelemetryLogger:
 
     def __init__(self):
         self._lock = threading.Lock()
+        # (ts, level, source, message) tuples — tuples of strings are untracked
+        # by the cyclic GC, unlike dicts; dicts are built only on read
         self._event_log: deque = deque(maxlen=MAX_MEMORY_LOGS)
         self._log_file: str | None = None
         self._log_handle = None
+        self._snap = Snapshot()
+        self._ts_cache = (0, "")   # (epoch ms, ISO string) — swapped as one tuple
+        # Encoded log lines; only the writer thread touches the file
+        self._write_q: queue.Queue = queue.Queue(maxsize=_WRITE_QUEUE_LEN)
+        self._closed = False
         os.makedirs(LOG_DIR, exist_ok=True)
         self._open_log_file()
+        self._writer = threading.Thread(
+            target=self._write_loop, daemon=True, name="TelemetryWriter"
+        )
+        self._writer.start()
+        atexit.register(self.close)   # flush the tail even without a clean shutdown
 
     # ── Log File Management ──────────────────────────────────────────────────
 
@@ -40,34 +90,80 @@ class TelemetryLogger:
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         self._log_file = os.path.join(LOG_DIR, f"telemetry_{ts}.jsonl")
         try:
-            self._log_handle = open(self._log_file, "a", buffering=1)
+            self._log_handle = open(self._log_file, "ab", buffering=64 * 1024)
             logger.info(f"[Telemetry] Logging to {self._log_file}")
         except Exception as exc:
             logger.warning(f"[Telemetry] Could not open log file: {exc}")
 
+    def _write_line(self, line: bytes) -> None:
+        """Hand a newline-terminated log line to the writer; never blocks."""
+        if self._log_handle and not self._closed:
+            try:
+                self._write_q.put_nowait(line)
+            except queue.Full:
+                pass   # disk is stalled — drop rather than stall the caller
+
+    def _write_loop(self) -> None:
+        """
+        Sole writer of the log file: joins everything queued into one
+        write, and flushes every _FLUSH_LINES lines or _FLUSH_INTERVAL
+        seconds, so the SD card sees a few large writes, not one per event.
+        """
+        unflushed = 0
+        last_flush = time.monotonic()
+        while True:
+            try:
+                lines = [self._write_q.get(timeout=_FLUSH_INTERVAL)]
+            except queue.Empty:
+                lines = []   # quiet period — still flush what is buffered
+            while lines and len(lines) < _WRITE_BATCH:
+                try:
+                    lines.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            # A line queued after close() may follow the sentinel; drop it
+            stop = None in lines
+            if stop:
+                del lines[lines.index(None):]
+            try:
+                if lines:
+                    self._log_handle.write(b"".join(lines))
+                    unflushed += len(lines)
+                now = time.monotonic()
+                if unflushed and (stop or unflushed >= _FLUSH_LINES
+                                  or now - last_flush >= _FLUSH_INTERVAL):
+                    self._log_handle.flush()
+                    unflushed, last_flush = 0, now
+            except Exception as exc:
+                logger.debug(f"[Telemetry] Log write failed: {exc}")
+            if stop:
+                return
+
+    def _now_iso(self) -> str:
+        """Current local time as ISO-8601 with ms; formatted once per millisecond."""
+        ms = time.time_ns() // 1_000_000
+        cached_ms, iso = self._ts_cache
+        if ms != cached_ms:
+            iso = datetime.fromtimestamp(ms / 1000).isoformat(timespec="milliseconds")
+            self._ts_cache = (ms, iso)
+        return iso
+
     # ── Event Logging ────────────────────────────────────────────────────────
 
     def log_event(self, level: str, source: str, message: str) -> None:
         """
         Record a named event. level: INFO | WARN | ERROR | CRITICAL
         """
-        entry = {
-            "ts":      datetime.now().isoformat(timespec="milliseconds"),
-            "level":   level.upper(),
-            "source":  source,
-            "message": message,
-        }
+        entry = (self._now_iso(), level.upper(), source, message)
         with self._lock:
             self._event_log.append(entry)
-            if self._log_handle:
-                try:
-                    self._log_handle.write(json.dumps(entry) + "\n")
-                except Exception:
-                    pass
+        self._write_line(_dumps(dict(zip(_EVENT_FIELDS, entry))) + b"\n")
 
     def get_recent_events(self, n: int = 100) -> list:
         with self._lock:
-            return list(self._event_log)[-n:]
+            log = self._event_log
+            recent = list(islice(log, max(0, len(log) - n), None)) if n > 0 else []
+        return [dict(zip(_EVENT_FIELDS, entry)) for entry in recent]
 
     # ── Snapshot ─────────────────────────────────────────────────────────────
 
@@ -83,34 +179,72 @@ class TelemetryLogger:
         ml_status: dict,
         led_status: dict,
         recording: bool,
-    ) -> dict:
-        """Assemble a full telemetry snapshot for WebSocket broadcast."""
-        snapshot = {
-            "ts": datetime.now().isoformat(timespec="milliseconds"),
-            "motor":      motor_status,
-            "servo":      servo_status,
-            "autonomous": autonomous_status,
-            "imu":        imu_status,
-            "power":      power_status,
-            "system":     sysmon_status,
-            "camera":     camera_status,
-            "ml":         ml_status,
-            "led":        led_status,
-            "recording":  recording,
-        }
-        # Write snapshot to disk
-        if self._log_handle:
-            try:
-                self._log_handle.write(json.dumps({"snapshot": snapshot}) + "\n")
-            except Exception:
-                pass
-        return snapshot
+    ) -> bytes:
+        """Update the shared snapshot, write it to disk and return it as JSON."""
+        snap = self._snap
+        snap.ts         = self._now_iso()
+        snap.motor      = motor_status
+        snap.servo      = servo_status
+        snap.autonomous = autonomous_status
+        snap.imu        = imu_status
+        snap.power      = power_status
+        snap.system     = sysmon_status
+        snap.camera     = camera_status
+        snap.ml         = ml_status
+        snap.led        = led_status
+        snap.recording  = recording
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(snap)
+        else:
+            data = json.dumps(asdict(snap), separators=(",", ":")).encode()
+        self._write_line(b'{"snapshot":' + data + b"}\n")
+        return data
+
+    def log_delta(self, changed: dict) -> None:
+        """Append only the subsystems that changed since the last tick."""
+        self._write_line(_dumps({"ts": self._now_iso(), "delta": changed}) + b"\n")
 
     # ── Cleanup ──────────────────────────────────────────────────────────────
 
     def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
         if self._log_handle:
+            # Let the writer drain what is queued before the file closes
+            try:
+                self._write_q.put(None, timeout=1.0)
+            except queue.Full:
+                logger.warning("[Telemetry] Log writer stalled — queued lines dropped")
+            else:
+                self._writer.join(timeout=2.0)
             try:
                 self._log_handle.close()
             except Exception:
                 pass
+
+
+class TelemetryBatcher:
+    """
+    Collects alerts raised during one broadcast tick so they go out with
+    that tick's status as a single message. May be fed from any thread.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+
+    def add_alert(self, level: str, source: str, message: str) -> None:
+        self._queue.put({"level": level, "source": source, "message": message})
+
+    def drain(self) -> dict:
+        """
+        Return ``{"alerts": [...]}`` for everything queued since the last
+        drain, in order, or ``{}`` if nothing was.
+        """
+        alerts: list = []
+        while True:
+            try:
+                alerts.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return {"alerts": alerts} if alerts else {}
@@ -0,0 +1,185 @@
+"""
+Parser and command-queue tests for modules.hardware.serial_comm.
+No Arduino needed: the controller is built without opening any port.
+"""
+
+import queue
+import threading
+
+import pytest
+
+pytest.importorskip("serial")
+
+from modules.hardware.serial_comm import (
+    _IMU_PAYLOAD, ArduinoController, _Mailboxes, _SerialChannel,
+)
+
+IMU_VALUES = (1.5, -2.0, 0.25, 0.5, 9.75)   # exact in float32
+
+
+def _frame(values=IMU_VALUES, checksum_delta: int = 0) -> bytes:
+    payload = _IMU_PAYLOAD.pack(*values)
+    return b"\xaa\x55" + payload + bytes([(sum(payload) + checksum_delta) & 0xFF])
+
+
+@pytest.fixture
+def ctl():
+    """An ArduinoController with in-memory channels and no threads."""
+    ctl = ArduinoController.__new__(ArduinoController)
+    ctl._tx = queue.Queue()
+    ctl._last_motor = {}
+    ctl._last_servo_angles = {}
+    ctl.latest_imu = {}
+    ctl.imu_event = threading.Event()
+    ctl.motor = _SerialChannel("motor", None, ctl._drain_motor_buffer)
+    ctl.servo = _SerialChannel("servo", None, ctl._drain_servo_buffer)
+    ctl._channels = (ctl.motor, ctl.servo)
+    ctl.motor.connected = True
+    yield ctl
+    ctl.motor.connected = False
+
+
+def _feed(ctl, *chunks: bytes, buf: bytearray | None = None) -> bytearray:
+    buf = bytearray() if buf is None else buf
+    for chunk in chunks:
+        buf += chunk
+        ctl._drain_servo_buffer(buf)
+    return buf
+
+
+def _imu_tuple(imu: dict) -> tuple:
+    return tuple(imu[k] for k in ("pitch", "roll", "ax", "ay", "az"))
+
+
+# ── Servo stream parser ──────────────────────────────────────────────────────
+
+def test_valid_imu_frame(ctl):
+    buf = _feed(ctl, _frame())
+    assert ctl.imu_event.is_set()
+    assert _imu_tuple(ctl.latest_imu) == IMU_VALUES
+    assert ctl.latest_imu["yaw"] == 0.0
+    assert buf == b""
+
+
+def test_corrupt_checksum_then_valid_frame(ctl):
+    buf = _feed(ctl, _frame((9.0, 9.0, 9.0, 9.0, 9.0), checksum_delta=1) + _frame())
+    assert _imu_tuple(ctl.latest_imu) == IMU_VALUES
+    assert buf == b""
+    assert list(ctl.servo.recent) == []
+
+
+def test_split_frame(ctl):
+    frame = _frame()
+    buf = _feed(ctl, frame[:1])
+    _feed(ctl, frame[1:9], buf=buf)
+    assert not ctl.imu_event.is_set()
+    assert buf == frame[:9]
+    _feed(ctl, frame[9:], buf=buf)
+    assert _imu_tuple(ctl.latest_imu) == IMU_VALUES
+    assert buf == b""
+
+
+def test_text_lines_around_frames(ctl):
+    _feed(ctl, b"STATUS:90,90,90,90\n" + _frame() + b"SERVO_READY\n")
+    assert _imu_tuple(ctl.latest_imu) == IMU_VALUES
+    assert list(ctl.servo.recent) == ["STATUS:90,90,90,90", "SERVO_READY"]
+
+
+def test_0xaa_inside_text_line(ctl):
+    buf = _feed(ctl, b"OK:\xaa1\n" + _frame())
+    assert list(ctl.servo.recent) == ["OK:1"]
+    assert _imu_tuple(ctl.latest_imu) == IMU_VALUES
+    assert buf == b""
+
+
+def test_text_imu_line(ctl):
+    _feed(ctl, b"IMU:1.0,2.0,0.1,0.2,9.8\n")
+    assert ctl.latest_imu["pitch"] == 1.0
+    assert ctl.latest_imu["az"] == 9.8
+
+
+# ── Motor command dedup and coalescing ───────────────────────────────────────
+
+def _queued(ctl) -> list:
+    items = []
+    while not ctl._tx.empty():
+        items.extend(ctl._tx.get_nowait()[1])
+    return items
+
+
+def test_repeated_motion_command_dropped(ctl):
+    ctl.send_motor_command("FORWARD")
+    ctl.send_motor_command("FORWARD")
+    assert _queued(ctl) == ["FORWARD"]
+
+
+def test_repeated_stop_always_sent(ctl):
+    ctl.send_motor_command("STOP")
+    ctl.send_motor_command("STOP")
+    assert _queued(ctl) == ["STOP", "STOP"]
+
+
+def _reconnect(ctl, channel, monkeypatch):
+    monkeypatch.setattr(channel, "connect", lambda: setattr(channel, "connected", True) or True)
+    ctl._connect(channel)
+
+
+def test_reconnect_resends_same_servo_angle(ctl, monkeypatch):
+    ctl.servo.connected = True
+    ctl.send_servo_command("S1:45")
+    ctl.send_servo_command("S1:45")
+    assert _queued(ctl) == ["S1:45"]
+    _reconnect(ctl, ctl.servo, monkeypatch)   # the Arduino re-centred its servos
+    ctl.send_servo_command("S1:45")
+    assert _queued(ctl) == ["S1:45"]
+
+
+def test_reconnect_resends_same_motor_command(ctl, monkeypatch):
+    ctl.send_motor_command("FORWARD")
+    _reconnect(ctl, ctl.motor, monkeypatch)
+    ctl.send_motor_command("FORWARD")
+    assert _queued(ctl) == ["FORWARD", "FORWARD"]
+
+
+def test_failed_write_forgets_sent_angle(ctl):
+    class _BrokenPort:
+        def write(self, data):
+            raise OSError("unplugged")
+
+    ctl.servo.connected = True
+    ctl.servo.serial = _BrokenPort()
+    ctl.send_servo_command("S2:120")
+    ctl._write_batch(ctl.servo, _queued(ctl))
+    assert not ctl.servo.connected
+    ctl.servo.connected = True
+    ctl.send_servo_command("S2:120")
+    assert _queued(ctl) == ["S2:120"]
+
+
+def test_stop_survives_coalescing():
+    commands = ["FORWARD", "SPEED:120", "LEFT", "STOP", "DA"]
+    assert ArduinoController._coalesce(commands) == ["SPEED:120", "STOP", "DA"]
+
+
+def test_coalesce_keeps_latest_per_key_in_order():
+    commands = ["S1:10", "S2:20", "S1:30", "LED:AUTO", "LEDC:1,2,3"]
+    assert ArduinoController._coalesce(commands) == ["S2:20", "S1:30", "LEDC:1,2,3"]
+
+
+# ── Reply mailboxes ──────────────────────────────────────────────────────────
+
+def test_mailbox_delivers_matching_reply():
+    mail = _Mailboxes()
+    event = mail.arm("STATUS")
+    mail.post("DIST_ALL:10,20,30")
+    assert not event.is_set()
+    mail.post("STATUS:200,FORWARD,40")
+    assert mail.take("STATUS", event, timeout=0.1) == "STATUS:200,FORWARD,40"
+    assert mail.take("DIST_ALL", mail.arm("DIST_ALL"), timeout=0.01) is None
+
+
+def test_mailbox_arm_forgets_previous_reply():
+    mail = _Mailboxes()
+    mail.post("STATUS:old")
+    event = mail.arm("STATUS")
+    assert mail.take("STATUS", event, timeout=0.01) is None